@@ -1,111 +1,73 @@
 # Import necessary libraries
-import numpy as np  # For numerical operations, especially for mathematical functions
-import pandas as pd  # For reading and manipulating data from Excel files
-import math  # For mathematical functions (although not explicitly used in the code, it can be useful)
+import argparse  # For the command line options
 
-def modified_penman_method(T_max, T_min, RH_mean, E, z, U_day_night, U_z, R_s, R_n):
-    """
-    Calculate Evapotranspiration (ET) using the Modified Penman Method.
+# Import the ET functions from the irrigation package
+from irrigation.et import modified_penman_batch, round_et  # Vectorized Modified Penman Method
+from irrigation.excel import read_sheet  # Excel input
+from irrigation.incremental import incremental_etr  # ETr for new and changed records only
+from irrigation.streaming import stream_station_etr  # Chunked ET for large station CSV files
+from irrigation.writers import write_etr_output  # Excel, Parquet, CSV or Arrow IPC output
 
-    Parameters:
-    - T_max: Maximum Temperature (°C)
-    - T_min: Minimum Temperature (°C)
-    - RH_mean: Maximum Relative Humidity (%)
-    - E: Elevation (m)
-    - z: Height (m)
-    - U_day_night: Day to Night Wind Ratio (daytime arbitrarily chosen as 0700-1900 hours)
-    - U_z: Wind Speed at Certain Height (km/day)
-    - R_s: Solar Radiation (cal/cm^2/day)
-    - R_n: Net Solar Radiation (mm/day)
+# Read data from Excel file containing climatic data
+file_path = "D:/E/Master Courses/Semesters/Fifth Semester/CE-577 Irrigation System Design and Management/Term Project 2/Climatic_Data.xlsx"
+sheet_name = "Kharif"  # Specify the sheet name that contains the data
 
-    Returns:
-    - ET: Estimated Evapotranspiration (mm/day)
+# Define the path to save the output results to a new Excel file (a .parquet, .csv
+# or .arrow extension writes that format instead)
+output_file_path = "D:/E/Master Courses/Semesters/Fifth Semester/CE-577 Irrigation System Design and Management/Term Project 2/ETr_Monthly.xlsx"
+
+# Function to parse the command line arguments
+def parse_args(argv=None):
     """
-    # Constants for the Modified Penman equation
-    a1 = 0.39  # Constant a1
-    b1 = -0.05  # Constant b1
-    
-    # Calculate the average temperature
-    T_mean = (T_max + T_min) / 2
-    
-    # Calculate wind speed at the 2m height (U_2)
-    U_2 = U_z * (pow((2/z), 0.2))
-    
-    # Adjust wind speed for day-night ratio
-    U_2day = (U_day_night / (U_day_night + 1)) * U_2 * (1000/43200)
-    
-    # Delta is the slope of the saturation vapor pressure curve
-    Delta = 2.00 * (pow((0.00738*T_mean) + 0.8072, 7)) - 0.00116
-    
-    # Atmospheric pressure (P) at the given elevation
-    P = 1013 - (0.1055 * E)
-    
-    # Latent heat of vaporization (L) as a function of temperature
-    L = 2500.78 - (2.3601 * T_mean)
-    
-    # Psychrometric constant (Gamma)
-    Gamma = 1.6134 * (P / L)
-    
-    # Coefficients used in the modified Penman equation
-    C1 = Delta / (Delta + Gamma)
-    C2 = 1 - C1
-    
-    # Adjust solar radiation (R_s) from cal/cm^2/day to mm/day
-    R_s = (R_s * 41868) / (L * 1000)
-    
-    # Calculate the saturation vapor pressure (e_s)
-    e_s = 33.8639 * (((0.00738 * T_mean + 0.8072)**8) - (0.000019 * ((1.8 * T_mean) + 48)) + 0.001316)
-    
-    # Calculate the actual vapor pressure (e_a) using relative humidity
-    e_a = e_s * (RH_mean / 100)
-    
-    # Calculate the final ET using the modified Penman method
-    c = 0.68 + (0.0028 * RH_mean) + (0.018 * R_s) - (0.068 * U_2day) + (0.013 * U_day_night) + (0.0097 * U_2day * U_day_night) + ((0.43*10**-4) * RH_mean * R_s * U_2day)
-    
-    # Calculate the Evapotranspiration (ET)
-    ET_r = c * ((C1 * R_n) + (C2 * 0.27 * (1.0 + (0.01 * U_2)) * (e_s - e_a)))
+    Parses the command line arguments.
 
-    return ET_r  # Return the estimated evapotranspiration
+    An input file ending in .csv is treated as a station archive and processed in
+    chunks of --chunk-rows records; otherwise the sheet of an Excel workbook is read.
+    With --store, ETr is kept in a Parquet store and only recomputed for records
+    that are new or changed since the last run.
+    """
+    parser = argparse.ArgumentParser(description="Calculate ETr with the Modified Penman Method.")
+    parser.add_argument('--input', default=file_path, help="Excel workbook, or CSV file of station records")
+    parser.add_argument('--sheet', default=sheet_name, help="Sheet of the Excel workbook with the climatic data")
+    parser.add_argument('--output', default=output_file_path, help="Output file (.xlsx, .parquet, .csv or .arrow)")
+    parser.add_argument('--chunk-rows', type=int, default=100_000, help="Records processed at a time for CSV input")
+    parser.add_argument('--store', help="Parquet store of ETr updated incrementally instead of writing --output")
+    parser.add_argument('--key', nargs='+', help="Columns identifying a record in the store "
+                                                 "(default: station date for CSV input, Month otherwise)")
+    return parser.parse_args(argv)
 
-# Read data from Excel file containing climatic data
-file_path = "D:/E/Master Courses/Semesters/Fifth Semester/CE-577 Irrigation System Design and Management/Term Project 2/Climatic_Data.xlsx"
-sheet_name = "Kharif"  # Specify the sheet name that contains the data
+def main(argv=None):
+    args = parse_args(argv)
 
-# Load the data into a pandas DataFrame
-df = pd.read_excel(file_path, sheet_name=sheet_name)
+    is_csv = args.input.lower().endswith('.csv')
 
-# Initialize an empty list to store ET results for each month
-et_results = []
+    if args.store:
+        import pandas as pd  # Loaded lazily, only for CSV input
 
-# Loop through each row in the DataFrame to calculate ET for each month
-for index, row in df.iterrows():
-    # Call the modified_penman_method function with values from the current row
-    et = modified_penman_method(
-        row['T_max'],  # Maximum temperature
-        row['T_min'],  # Minimum temperature
-        row['RH_mean'],  # Relative humidity
-        row['E'],  # Elevation
-        row['z'],  # Height
-        row['U_day_night'],  # Day to night wind ratio
-        row['U_z'],  # Wind speed at height z
-        row['R_s'],  # Solar radiation
-        row['R_n']  # Net solar radiation
-    )
-    
-    # Append the rounded ET result to the list
-    et_results.append(round(et, 2))
+        # Load all records, since changes are detected by comparing every record with the store
+        df = pd.read_csv(args.input) if is_csv else read_sheet(args.input, args.sheet)
+        key = args.key or (['station', 'date'] if is_csv else ['Month'])
+        result, recomputed = incremental_etr(df, args.store, key)
+        print(f"ETr recomputed for {recomputed} of {len(result)} records and saved to {args.store}")
+        return
 
-# Create a new DataFrame to store the calculated ET results alongside the month names
-et_df = pd.DataFrame({
-    'Month': df['Month'],  # Month column from the input data
-    'ETr': et_results  # Estimated evapotranspiration results
-})
+    if is_csv:
+        # Stream the station records so memory stays bounded by the chunk size
+        rows = stream_station_etr(args.input, args.output, args.chunk_rows)
+        print(f"ETr results for {rows} records saved to {args.output}")
+        return
 
-# Define the path to save the output results to a new Excel file
-output_file_path = "D:/E/Master Courses/Semesters/Fifth Semester/CE-577 Irrigation System Design and Management/Term Project 2/ETr_Monthly.xlsx"
+    # Load the data into a pandas DataFrame
+    df = read_sheet(args.input, args.sheet)
+
+    # Calculate ET for every month in one vectorized call and round the results
+    et_results = round_et(modified_penman_batch(df)).tolist()
+
+    # Save the results alongside the month names to the output file
+    write_etr_output(df['Month'], et_results, args.output)
 
-# Save the results to an Excel file
-et_df.to_excel(output_file_path, index=False)
+    # Print confirmation message
+    print(f"ETr results saved to {args.output}")
 
-# Print confirmation message
-print(f"ETr results saved to {output_file_path}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
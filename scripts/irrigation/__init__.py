@@ -0,0 +1,92 @@
+"""
+Irrigation scheduling tools for CE-577: Irrigation System Design and Management.
+
+Importing this package has no side effects and does not load pandas or
+openpyxl; those are only imported by irrigation.excel when a workbook is
+actually read or written.
+"""
+from irrigation.batch import (
+    BatchScheduleResult,
+    PlantingDateResult,
+    batch_irrigation_schedule,
+    crop_stage_arrays,
+    daily_kc_matrix,
+    planting_date_sweep,
+)
+from irrigation.et import (
+    ET_METHODS,
+    METHOD_COLUMNS,
+    PENMAN_COLUMNS,
+    STATION_COLUMNS,
+    STATION_METADATA,
+    STATION_RECORD_COLUMNS,
+    ETTerms,
+    StationTable,
+    TemperatureTables,
+    extraterrestrial_radiation,
+    modified_penman_batch,
+    modified_penman_method,
+    reference_et_batch,
+    station_et_batch,
+)
+from irrigation.scheduling import (
+    DATED_SCHEDULE_RECORD_KEYS,
+    GROWTH_STAGE_COLUMNS,
+    KC_CURVES,
+    SCHEDULE_RECORD_KEYS,
+    ScheduleResult,
+    accumulate_soil_water_deficit,
+    calculate_et,
+    crop_kc_curve,
+    daily_irrigation_schedule,
+    daily_kc_curve,
+    growth_stages,
+    interpolate_monthly_to_daily,
+    interpolate_monthly_to_daily_batch,
+    interpolation_operator,
+    schedule_by_date,
+    schedule_daily_series,
+    schedule_days,
+    season_calendar,
+)
+
+__all__ = [
+    'BatchScheduleResult',
+    'DATED_SCHEDULE_RECORD_KEYS',
+    'ETTerms',
+    'ET_METHODS',
+    'GROWTH_STAGE_COLUMNS',
+    'KC_CURVES',
+    'METHOD_COLUMNS',
+    'PENMAN_COLUMNS',
+    'PlantingDateResult',
+    'SCHEDULE_RECORD_KEYS',
+    'STATION_COLUMNS',
+    'STATION_METADATA',
+    'STATION_RECORD_COLUMNS',
+    'ScheduleResult',
+    'StationTable',
+    'TemperatureTables',
+    'accumulate_soil_water_deficit',
+    'batch_irrigation_schedule',
+    'calculate_et',
+    'crop_kc_curve',
+    'crop_stage_arrays',
+    'daily_irrigation_schedule',
+    'daily_kc_curve',
+    'daily_kc_matrix',
+    'extraterrestrial_radiation',
+    'growth_stages',
+    'interpolate_monthly_to_daily',
+    'interpolate_monthly_to_daily_batch',
+    'interpolation_operator',
+    'modified_penman_batch',
+    'modified_penman_method',
+    'planting_date_sweep',
+    'reference_et_batch',
+    'schedule_by_date',
+    'schedule_daily_series',
+    'schedule_days',
+    'season_calendar',
+    'station_et_batch',
+]
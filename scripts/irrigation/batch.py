@@ -0,0 +1,233 @@
+"""
+Soil water balance for many fields at once.
+
+batch_irrigation_schedule runs the same daily water balance as
+daily_irrigation_schedule, but for arrays of fields: it loops only over the
+days of the season and updates the soil water deficit, the irrigation trigger
+and the applied water of all fields together with NumPy masks.
+planting_date_sweep uses it to evaluate every sowing date of a window at once,
+treating each sowing date as a field.
+"""
+# Import necessary libraries
+from collections import namedtuple  # For the result of the batch water balance
+
+import numpy as np  # For the per-field arrays
+
+from irrigation.scheduling import crop_kc_curve, daily_kc_curve
+
+# Result of batch_irrigation_schedule. The daily arrays have shape (days, fields) and
+# are None unless daily results were requested; the totals have shape (fields,).
+BatchScheduleResult = namedtuple('BatchScheduleResult', [
+    'season_length',  # Days in the season of each field
+    'total_etc',  # Seasonal crop evapotranspiration (mm)
+    'total_irrigation',  # Seasonal net irrigation application (mm)
+    'irrigation_events',  # Number of irrigations in the season
+    'final_soil_water_deficit',  # Cumulative soil water deficit at the end of the season (mm)
+    'etc',  # Daily crop evapotranspiration (mm/day)
+    'net_irrigation',  # Daily net irrigation application (mm)
+    'soil_water_deficit',  # Daily cumulative soil water deficit (mm)
+    'irrigation_required',  # Whether irrigation is required on each day
+])
+
+# Result of planting_date_sweep, with one value per sowing date
+PlantingDateResult = namedtuple('PlantingDateResult', [
+    'sowing_date',  # Sowing date (datetime64[D])
+    'total_etc',  # Seasonal crop evapotranspiration (mm)
+    'total_irrigation',  # Seasonal net irrigation application (mm)
+    'irrigation_events',  # Number of irrigations in the season
+    'final_soil_water_deficit',  # Cumulative soil water deficit at the end of the season (mm)
+])
+
+
+# Function to collect the growth stage tables of many crops into arrays
+def crop_stage_arrays(crops):
+    """
+    Collects the crop coefficients and durations of the growth stages of many fields.
+
+    Parameters:
+    - crops: List of crop dictionaries, one per field, each with 'growth_stages' as
+      built by irrigation.scheduling.growth_stages
+
+    Returns:
+    - stage_kc: Array (fields x stages) of crop coefficients
+    - stage_days: Array (fields x stages) of growth stage durations in days
+    """
+    stage_kc = np.array([[properties['kc'] for properties in crop['growth_stages'].values()] for crop in crops], dtype=float)
+    stage_days = np.array([[properties['days'] for properties in crop['growth_stages'].values()] for crop in crops], dtype=np.int64)
+    return stage_kc, stage_days
+
+# Function to lay out the growth stages of many fields over the days of the season
+def daily_kc_matrix(stage_kc, stage_days, days=None, kc_curve='stages'):
+    """
+    Builds the daily crop coefficient of many fields from their growth stages.
+
+    With kc_curve='fao56' the Kc curve of each distinct crop is taken from the
+    cache of crop_kc_curve, and each field takes the column of its crop.
+
+    Parameters:
+    - stage_kc: Array (fields x stages) of crop coefficients
+    - stage_days: Array (fields x stages) of growth stage durations in days
+    - days: Number of days to lay out (default: the longest season)
+    - kc_curve: Shape of the daily Kc curve, 'stages' or 'fao56' (see crop_kc_curve)
+
+    Returns:
+    - kc: Array (days x fields) of daily crop coefficients, 0 after a field's season ends
+    - active: Boolean array (days x fields), True on the days of each field's season
+    """
+    stage_kc = np.atleast_2d(np.asarray(stage_kc, dtype=float))
+    stage_ends = np.cumsum(np.atleast_2d(stage_days), axis=1)
+    if days is None:
+        days = int(stage_ends[:, -1].max())
+
+    # Growth stage of each field on each day: the number of stages already finished
+    day = np.arange(days).reshape(-1, 1, 1)
+    stage = (day >= stage_ends[np.newaxis]).sum(axis=2)
+    active = stage < stage_kc.shape[1]
+    if kc_curve == 'stages':
+        kc = np.take_along_axis(stage_kc.T, np.minimum(stage, stage_kc.shape[1] - 1), axis=0)
+        return np.where(active, kc, 0.0), active
+
+    # Stack the cached curve of each distinct crop and pick each field's column from it
+    stage_days = np.atleast_2d(stage_days)
+    _, first_field, field_crop = np.unique(np.concatenate([stage_kc, stage_days], axis=1), axis=0,
+                                           return_index=True, return_inverse=True)
+    curves = np.zeros((days, len(first_field)))
+    for crop, field in enumerate(first_field):
+        curve = crop_kc_curve(tuple(stage_kc[field].tolist()), tuple(stage_days[field].tolist()), kc_curve)[:days]
+        curves[:len(curve), crop] = curve
+    kc = curves[:, field_crop.ravel()]
+    return kc, active
+
+# Function to run the daily soil water balance of many fields at once
+def batch_irrigation_schedule(field_capacity, wilting_point, root_depth, daily_kc, daily_etr, daily_rainfall, active=None, keep_daily=False):
+    """
+    Generates irrigation schedules for many fields with one loop over the days of the season.
+
+    For every field the water balance is the same as in daily_irrigation_schedule:
+    the deficit accumulates effective rainfall minus ETc, and when it exceeds the
+    maximum allowable depletion the field is irrigated and the deficit reset.
+
+    Parameters:
+    - field_capacity: Array (fields) of soil field capacities
+    - wilting_point: Array (fields) of soil wilting points
+    - root_depth: Array (fields) of crop root depths
+    - daily_kc: Array (days x fields) of daily crop coefficients (see daily_kc_matrix)
+    - daily_etr: Array of daily ETr (mm/day), (days x fields) or (days) shared by all fields
+    - daily_rainfall: Array of daily rainfall (mm), (days x fields) or (days) shared by all fields
+    - active: Boolean array (days x fields) of the days in each field's season (default: all days)
+    - keep_daily: Whether to return the daily arrays as well as the seasonal totals
+
+    Returns:
+    - BatchScheduleResult with seasonal totals per field and, if requested, daily arrays
+    """
+    daily_kc = np.asarray(daily_kc, dtype=float)
+    days, fields = daily_kc.shape
+    daily_etr = np.asarray(daily_etr, dtype=float)[:days]
+    daily_rainfall = np.asarray(daily_rainfall, dtype=float)[:days]
+    if len(daily_etr) < days or len(daily_rainfall) < days:
+        raise IndexError(f"Growth stages last {days} days but climate data covers only {min(len(daily_etr), len(daily_rainfall))} days")
+    if daily_etr.ndim == 1:
+        daily_etr = daily_etr[:, np.newaxis]
+    if daily_rainfall.ndim == 1:
+        daily_rainfall = daily_rainfall[:, np.newaxis]
+    if active is None:
+        active = np.ones((days, fields), dtype=bool)
+
+    # Max allowable soil depletion of each field
+    max_allowable_depletion = 0.7 * (np.asarray(field_capacity, dtype=float) - np.asarray(wilting_point, dtype=float)) * np.asarray(root_depth, dtype=float) * 10
+    max_allowable_depletion = np.broadcast_to(max_allowable_depletion, (fields,))
+
+    # Crop water use (ETc) and daily net water balance, zero outside each field's season
+    etc = np.where(active, daily_etr * daily_kc, 0.0)
+    effective_rainfall = np.maximum(daily_rainfall - 0, 0)  # No losses in this example
+    soil_water_balance = np.where(active, effective_rainfall - etc, 0.0)
+
+    cumulative_soil_water_deficit = np.zeros(fields)
+    irrigation_events = np.zeros(fields, dtype=np.int64)
+    if keep_daily:
+        soil_water_deficit = np.empty((days, fields))
+        irrigation_required = np.empty((days, fields), dtype=bool)
+
+    # Process each day of the season for all fields together
+    for day in range(days):
+        cumulative_soil_water_deficit += soil_water_balance[day]
+
+        # Irrigate the fields whose deficit exceeds the max allowable depletion
+        irrigate = (cumulative_soil_water_deficit > max_allowable_depletion) & active[day]
+        cumulative_soil_water_deficit[irrigate] = 0
+        irrigation_events += irrigate
+        if keep_daily:
+            soil_water_deficit[day] = cumulative_soil_water_deficit
+            irrigation_required[day] = irrigate
+
+    total_irrigation = irrigation_events * max_allowable_depletion
+    return BatchScheduleResult(
+        season_length=active.sum(axis=0),
+        total_etc=etc.sum(axis=0),
+        total_irrigation=total_irrigation,
+        irrigation_events=irrigation_events,
+        final_soil_water_deficit=cumulative_soil_water_deficit,
+        etc=etc if keep_daily else None,
+        net_irrigation=np.where(irrigation_required, max_allowable_depletion, 0.0) if keep_daily else None,
+        soil_water_deficit=soil_water_deficit if keep_daily else None,
+        irrigation_required=irrigation_required if keep_daily else None,
+    )
+
+# Function to evaluate every sowing date of a window in one pass
+def planting_date_sweep(soil, crop, dates, daily_etr, daily_rainfall, first_sowing_date, sowing_days=90, kc_curve='stages'):
+    """
+    Calculates the seasonal irrigation demand of a crop for every sowing date in a window.
+
+    The daily crop coefficients are laid out once, and the season of each sowing
+    date is a sliding-window view of the daily ETr and rainfall (no copies), so all
+    sowing dates run through one batch water balance as if they were separate fields.
+
+    Parameters:
+    - soil: Dictionary containing soil properties (e.g., field capacity, wilting point)
+    - crop: Dictionary containing crop properties (e.g., growth stages, crop coefficient)
+    - dates: Array of dates of the daily climate data, in increasing order
+    - daily_etr: Array of daily ETr (mm/day), one value per date
+    - daily_rainfall: Array of daily rainfall (mm), one value per date
+    - first_sowing_date: First sowing date of the window (e.g., '2024-03-01')
+    - sowing_days: Number of consecutive sowing dates to evaluate
+    - kc_curve: Shape of the daily Kc curve, 'stages' or 'fao56' (see crop_kc_curve)
+
+    Returns:
+    - PlantingDateResult with the seasonal totals of each sowing date
+
+    Raises:
+    - KeyError: If the first sowing date is not in the climate data
+    - ValueError: If the climate data misses a day of the seasons of the window
+    """
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    first_sowing_date = np.datetime64(first_sowing_date, 'D')
+    start = int(np.searchsorted(dates, first_sowing_date))
+    if start == len(dates) or dates[start] != first_sowing_date:
+        raise KeyError(str(first_sowing_date))
+
+    # Daily crop coefficients of the season, shared by all sowing dates
+    kc = daily_kc_curve(crop, kc_curve)
+    season_length = len(kc)
+
+    # Climate from the first sowing date to the end of the season of the last one
+    period = slice(start, start + sowing_days - 1 + season_length)
+    period_dates = dates[period]
+    if len(period_dates) < sowing_days - 1 + season_length or (np.diff(period_dates) != np.timedelta64(1, 'D')).any():
+        raise ValueError(f"Daily climate data must cover every day from {first_sowing_date} "
+                         f"for {sowing_days - 1 + season_length} days")
+
+    # Season of each sowing date as a column of a (days x sowing dates) strided view
+    def seasons(daily):
+        return np.lib.stride_tricks.sliding_window_view(np.asarray(daily, dtype=float)[period], season_length).T
+
+    result = batch_irrigation_schedule(
+        soil['field_capacity'], soil['wilting_point'], crop['root_depth'],
+        np.broadcast_to(kc[:, np.newaxis], (season_length, sowing_days)), seasons(daily_etr), seasons(daily_rainfall),
+    )
+    return PlantingDateResult(
+        sowing_date=period_dates[:sowing_days],
+        total_etc=result.total_etc,
+        total_irrigation=result.total_irrigation,
+        irrigation_events=result.irrigation_events,
+        final_soil_water_deficit=result.final_soil_water_deficit,
+    )
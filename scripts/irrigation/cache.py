@@ -0,0 +1,179 @@
+"""
+Binary sidecar cache for sheets parsed from Excel workbooks.
+
+Each sheet is stored as a Parquet file together with a manifest recording the
+size, modification time and SHA-256 hash of the source workbook. A cached
+sheet is reused while the workbook is unchanged: a matching size and mtime is
+accepted directly, and a changed mtime falls back to comparing the hash, so
+touching a file does not throw its cache away. Any other change invalidates
+the cache automatically.
+
+The cache lives in a '.irrigation_cache' directory next to the workbook,
+unless a cache directory is passed explicitly or set through the
+IRRIGATION_CACHE_DIR environment variable. Parquet support needs pyarrow;
+without it sheets are simply read from the workbook every time.
+"""
+# Import necessary libraries
+import hashlib  # For hashing the source workbook
+import json  # For the cache manifest
+import os  # For file paths and file metadata
+
+from irrigation.files import temporary_path  # Unique temporary files while writing the cache
+
+# Environment variable that overrides the default cache location
+CACHE_DIR_ENV = 'IRRIGATION_CACHE_DIR'
+
+# Name of the cache directory created next to a workbook by default
+DEFAULT_CACHE_DIRNAME = '.irrigation_cache'
+
+# Name of the manifest file inside the cache directory of a workbook
+MANIFEST_NAME = 'manifest.json'
+
+
+# Function to find the cache directory of a workbook
+def cache_directory(file_path, cache_dir=None):
+    """
+    Returns the directory holding the cached sheets of a workbook.
+
+    Parameters:
+    - file_path: Path to the Excel workbook
+    - cache_dir: Directory for all cached workbooks (default: IRRIGATION_CACHE_DIR, or
+      a '.irrigation_cache' directory next to the workbook)
+
+    Returns:
+    - Path of the cache directory for this workbook
+    """
+    file_path = os.path.abspath(file_path)
+    cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV)
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(file_path), DEFAULT_CACHE_DIRNAME)
+    # Workbooks with the same name in different folders get separate caches
+    path_key = hashlib.sha1(file_path.encode('utf-8')).hexdigest()[:8]
+    return os.path.join(cache_dir, f"{os.path.basename(file_path)}-{path_key}")
+
+# Function to compute the SHA-256 hash of a file
+def _file_hash(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+# Function to load the manifest of a workbook cache, or None if it is missing or unreadable
+def _read_manifest(directory):
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+# Function to save the manifest of a workbook cache atomically
+def _write_manifest(directory, manifest):
+    path = os.path.join(directory, MANIFEST_NAME)
+    temporary_file = temporary_path(path)
+    with open(temporary_file, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(temporary_file, path)
+
+# Function to load the manifest of a workbook cache if it still matches the workbook
+def _valid_manifest(file_path, directory):
+    manifest = _read_manifest(directory)
+    if manifest is None:
+        return None
+    stat = os.stat(file_path)
+    if manifest['size'] == stat.st_size and manifest['mtime_ns'] == stat.st_mtime_ns:
+        return manifest
+    # The modification time changed, so only trust the cache if the contents did not
+    if manifest['size'] == stat.st_size and manifest['sha256'] == _file_hash(file_path):
+        manifest['mtime_ns'] = stat.st_mtime_ns
+        _write_manifest(directory, manifest)
+        return manifest
+    return None
+
+# Function to read the cached sheets of a workbook
+def read_cached_sheets(file_path, sheet_names, cache_dir=None):
+    """
+    Reads the sheets of a workbook that are present in its cache.
+
+    Parameters:
+    - file_path: Path to the Excel workbook
+    - sheet_names: Names of the sheets to read
+    - cache_dir: Cache location (see cache_directory)
+
+    Returns:
+    - sheets: Dictionary of the cached sheets found, as DataFrames
+    - workbook_sheet_names: List of all sheet names in the workbook, or None if the
+      cache is missing or out of date
+    """
+    directory = cache_directory(file_path, cache_dir)
+    manifest = _valid_manifest(file_path, directory)
+    if manifest is None:
+        return {}, None
+
+    import pandas as pd  # Loaded lazily, only when a cached sheet is read
+
+    sheets = {}
+    for sheet_name in sheet_names:
+        cached_file = manifest['sheets'].get(sheet_name)
+        if cached_file is None:
+            continue
+        try:
+            sheets[sheet_name] = pd.read_parquet(os.path.join(directory, cached_file))
+        except ImportError:
+            continue  # pyarrow is not installed, read the sheet from the workbook instead
+        except (OSError, ValueError):
+            # Unreadable (e.g., truncated) cache file: drop it, so the sheet is read
+            # from the workbook instead and cached again
+            del manifest['sheets'][sheet_name]
+            _write_manifest(directory, manifest)
+            try:
+                os.remove(os.path.join(directory, cached_file))
+            except OSError:
+                pass
+    return sheets, manifest['workbook_sheet_names']
+
+# Function to write sheets of a workbook to its cache
+def write_cached_sheets(file_path, sheets, workbook_sheet_names, cache_dir=None):
+    """
+    Writes parsed sheets of a workbook to its cache, replacing an out of date cache.
+
+    Sheets that cannot be stored as Parquet (or all sheets, if pyarrow is not
+    installed) are left out of the cache and will be read from the workbook again.
+
+    Parameters:
+    - file_path: Path to the Excel workbook
+    - sheets: Dictionary of sheet names and DataFrames to cache
+    - workbook_sheet_names: List of all sheet names in the workbook
+    - cache_dir: Cache location (see cache_directory)
+    """
+    directory = cache_directory(file_path, cache_dir)
+    os.makedirs(directory, exist_ok=True)
+
+    stat = os.stat(file_path)
+    manifest = _valid_manifest(file_path, directory)
+    if manifest is None:
+        manifest = {
+            'source': os.path.abspath(file_path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': _file_hash(file_path),
+            'workbook_sheet_names': list(workbook_sheet_names),
+            'sheets': {},
+        }
+
+    for sheet_name, sheet in sheets.items():
+        cached_file = f"sheet-{hashlib.sha1(sheet_name.encode('utf-8')).hexdigest()[:12]}.parquet"
+        path = os.path.join(directory, cached_file)
+        temporary_file = temporary_path(path)
+        try:
+            sheet.to_parquet(temporary_file, index=False)
+        except ImportError:
+            return  # pyarrow is not installed, so nothing can be cached
+        except (TypeError, ValueError, NotImplementedError):
+            # Mixed-type columns that Parquet cannot store
+            if os.path.exists(temporary_file):
+                os.remove(temporary_file)
+            continue
+        os.replace(temporary_file, path)
+        manifest['sheets'][sheet_name] = cached_file
+    _write_manifest(directory, manifest)
@@ -0,0 +1,156 @@
+"""
+Persistent daily field-state checkpoints.
+
+Each morning brings a few new days of weather per field. Instead of
+simulating the season again from day 1, update_field_checkpoints loads the
+last checkpoint of each field (days scheduled so far, growth stage, Kc and
+soil water deficit), advances it by the new days only with schedule_days and
+saves the new checkpoints. The checkpoints of all fields are stored together
+as one column per state variable in a compressed .npz file.
+"""
+# Import necessary libraries
+import os  # For replacing the checkpoint file atomically
+from collections import namedtuple  # For the state of a field
+
+import numpy as np  # For the checkpoint columns
+
+from irrigation.files import temporary_path  # Unique temporary files while saving
+from irrigation.scheduling import schedule_days
+
+# State of a field at the end of its last scheduled day
+FieldState = namedtuple('FieldState', ['day', 'stage_index', 'kc', 'soil_water_deficit'])
+FieldState.__doc__ = """
+State of a field at the end of its last scheduled day.
+
+Attributes:
+- day: Number of days of the season scheduled so far (0 before sowing)
+- stage_index: Index of the growth stage of the last scheduled day
+- kc: Crop coefficient of the last scheduled day
+- soil_water_deficit: Unrounded cumulative soil water deficit (mm)
+"""
+
+# Function to get the state of a field before the first day of the season
+def initial_field_state(crop):
+    """
+    Returns the state of a field before the first day of the season.
+
+    Parameters:
+    - crop: Dictionary containing crop properties (e.g., growth stages, crop coefficient)
+
+    Returns:
+    - FieldState of the field on sowing
+    """
+    first_stage = next(iter(crop['growth_stages'].values()))
+    return FieldState(0, 0, float(first_stage['kc']), 0.0)
+
+# Function to advance the state of a field by new days
+def advance_field_state(state, soil, crop, daily_etr, daily_rainfall, growing_season='Kharif', kc_curve='stages',
+                        skip_to_events=False):
+    """
+    Schedules the new days of a field, starting from its last state.
+
+    Days after the end of the season are ignored.
+
+    Parameters:
+    - state: FieldState of the field (see initial_field_state)
+    - soil: Dictionary containing soil properties (e.g., field capacity, wilting point)
+    - crop: Dictionary containing crop properties (e.g., growth stages, crop coefficient)
+    - daily_etr: Array of daily ETr (mm/day) of the new days
+    - daily_rainfall: Array of daily rainfall (mm) of the new days
+    - growing_season: Name of the growing season (e.g., Kharif or Rabi)
+    - kc_curve: Shape of the daily Kc curve, 'stages' or 'fao56' (see crop_kc_curve)
+    - skip_to_events: Whether to jump between irrigations (see accumulate_soil_water_deficit)
+
+    Returns:
+    - schedule: ScheduleResult of the new days, numbered from state.day + 1
+    - state: FieldState at the end of the last new day
+    """
+    season_length = sum(int(properties['days']) for properties in crop['growth_stages'].values())
+    days = max(0, min(len(daily_etr), season_length - state.day))
+
+    schedule, soil_water_deficit = schedule_days(
+        soil, crop, np.asarray(daily_etr)[:days], np.asarray(daily_rainfall)[:days],
+        start_day=state.day, soil_water_deficit=state.soil_water_deficit, growing_season=growing_season,
+        kc_curve=kc_curve, skip_to_events=skip_to_events,
+    )
+    if days == 0:
+        return schedule, state
+    return schedule, FieldState(
+        state.day + days, int(schedule.stage_index[-1]), float(schedule.kc[-1]), float(soil_water_deficit),
+    )
+
+# Function to load the checkpoints of all fields
+def load_field_states(file_path):
+    """
+    Loads the checkpoints saved by save_field_states.
+
+    Parameters:
+    - file_path: Path of the checkpoint file
+
+    Returns:
+    - Dictionary mapping field ids to their FieldState (empty if the file does not exist)
+    """
+    if not os.path.exists(file_path):
+        return {}
+    with np.load(file_path) as columns:
+        return {
+            field: FieldState(day, stage_index, kc, soil_water_deficit)
+            for field, day, stage_index, kc, soil_water_deficit in zip(*(
+                columns[name].tolist() for name in ('field',) + FieldState._fields
+            ))
+        }
+
+# Function to save the checkpoints of all fields
+def save_field_states(file_path, states):
+    """
+    Saves the checkpoints of all fields as one compressed column per state variable.
+
+    Parameters:
+    - file_path: Path of the checkpoint file
+    - states: Dictionary mapping field ids to their FieldState
+    """
+    values = list(states.values())
+    columns = {
+        'field': np.array([str(field) for field in states], dtype=str),
+        'day': np.array([state.day for state in values], dtype=np.int32),
+        'stage_index': np.array([state.stage_index for state in values], dtype=np.int8),
+        'kc': np.array([state.kc for state in values], dtype=np.float64),
+        'soil_water_deficit': np.array([state.soil_water_deficit for state in values], dtype=np.float64),
+    }
+    # Write to a temporary file first so an interrupted save keeps the old checkpoints;
+    # its name is unique so that concurrent saves never write into the same file
+    temporary_file = temporary_path(file_path)
+    with open(temporary_file, 'wb') as file:
+        np.savez_compressed(file, **columns)
+    os.replace(temporary_file, file_path)
+
+# Function to advance the checkpoints of many fields by their new days
+def update_field_checkpoints(file_path, fields, new_weather, growing_season='Kharif', kc_curve='stages',
+                             skip_to_events=False):
+    """
+    Loads the field checkpoints, schedules the new days of each field and saves the new checkpoints.
+
+    Fields without a checkpoint start on the first day of the season. Checkpoints
+    of fields without new weather are kept unchanged.
+
+    Parameters:
+    - file_path: Path of the checkpoint file
+    - fields: Dictionary mapping field ids to their (soil, crop) dictionaries
+    - new_weather: Dictionary mapping field ids to their (daily_etr, daily_rainfall) arrays of the new days
+    - growing_season: Name of the growing season (e.g., Kharif or Rabi)
+    - kc_curve: Shape of the daily Kc curve, 'stages' or 'fao56' (see crop_kc_curve)
+    - skip_to_events: Whether to jump between irrigations (see accumulate_soil_water_deficit)
+
+    Returns:
+    - Dictionary mapping field ids to the ScheduleResult of their new days
+    """
+    states = load_field_states(file_path)
+    schedules = {}
+    for field, (daily_etr, daily_rainfall) in new_weather.items():
+        soil, crop = fields[field]
+        state = states.get(str(field)) or initial_field_state(crop)
+        schedules[field], states[str(field)] = advance_field_state(
+            state, soil, crop, daily_etr, daily_rainfall, growing_season, kc_curve, skip_to_events,
+        )
+    save_field_states(file_path, states)
+    return schedules
@@ -0,0 +1,580 @@
+"""
+Reference evapotranspiration (ETr) using the Modified Penman Method.
+
+The batch functions evaluate many records at once and also offer the FAO-56
+Penman-Monteith and Hargreaves-Samani methods, which share intermediate terms
+with the Modified Penman Method.
+
+This module only depends on NumPy, so it can be imported by worker processes
+without loading pandas or openpyxl.
+"""
+# Import necessary libraries
+import functools  # For evaluating shared intermediate terms once
+import numpy as np  # For vectorized evaluation of the ET terms
+
+
+def modified_penman_method(T_max, T_min, RH_mean, E, z, U_day_night, U_z, R_s, R_n):
+    """
+    Calculate Evapotranspiration (ET) using the Modified Penman Method.
+
+    Parameters:
+    - T_max: Maximum Temperature (°C)
+    - T_min: Minimum Temperature (°C)
+    - RH_mean: Maximum Relative Humidity (%)
+    - E: Elevation (m)
+    - z: Height (m)
+    - U_day_night: Day to Night Wind Ratio (daytime arbitrarily chosen as 0700-1900 hours)
+    - U_z: Wind Speed at Certain Height (km/day)
+    - R_s: Solar Radiation (cal/cm^2/day)
+    - R_n: Net Solar Radiation (mm/day)
+
+    Returns:
+    - ET: Estimated Evapotranspiration (mm/day)
+    """
+    # Constants for the Modified Penman equation
+    a1 = 0.39  # Constant a1
+    b1 = -0.05  # Constant b1
+    
+    # Calculate the average temperature
+    T_mean = (T_max + T_min) / 2
+    
+    # Calculate wind speed at the 2m height (U_2)
+    U_2 = U_z * (pow((2/z), 0.2))
+    
+    # Adjust wind speed for day-night ratio
+    U_2day = (U_day_night / (U_day_night + 1)) * U_2 * (1000/43200)
+    
+    # Delta is the slope of the saturation vapor pressure curve
+    Delta = 2.00 * (pow((0.00738*T_mean) + 0.8072, 7)) - 0.00116
+    
+    # Atmospheric pressure (P) at the given elevation
+    P = 1013 - (0.1055 * E)
+    
+    # Latent heat of vaporization (L) as a function of temperature
+    L = 2500.78 - (2.3601 * T_mean)
+    
+    # Psychrometric constant (Gamma)
+    Gamma = 1.6134 * (P / L)
+    
+    # Coefficients used in the modified Penman equation
+    C1 = Delta / (Delta + Gamma)
+    C2 = 1 - C1
+    
+    # Adjust solar radiation (R_s) from cal/cm^2/day to mm/day
+    R_s = (R_s * 41868) / (L * 1000)
+    
+    # Calculate the saturation vapor pressure (e_s)
+    e_s = 33.8639 * (((0.00738 * T_mean + 0.8072)**8) - (0.000019 * ((1.8 * T_mean) + 48)) + 0.001316)
+    
+    # Calculate the actual vapor pressure (e_a) using relative humidity
+    e_a = e_s * (RH_mean / 100)
+    
+    # Calculate the final ET using the modified Penman method
+    c = 0.68 + (0.0028 * RH_mean) + (0.018 * R_s) - (0.068 * U_2day) + (0.013 * U_day_night) + (0.0097 * U_2day * U_day_night) + ((0.43*10**-4) * RH_mean * R_s * U_2day)
+    
+    # Calculate the Evapotranspiration (ET)
+    ET_r = c * ((C1 * R_n) + (C2 * 0.27 * (1.0 + (0.01 * U_2)) * (e_s - e_a)))
+
+    return ET_r  # Return the estimated evapotranspiration
+
+# Column names expected by the batch version of the Modified Penman Method
+PENMAN_COLUMNS = ['T_max', 'T_min', 'RH_mean', 'E', 'z', 'U_day_night', 'U_z', 'R_s', 'R_n']
+
+# Column names needed by each method of reference_et_batch
+METHOD_COLUMNS = {
+    'modified_penman': PENMAN_COLUMNS,
+    'penman_monteith': ['T_max', 'T_min', 'RH_mean', 'E', 'z', 'U_z', 'R_n'],
+    'hargreaves_samani': ['T_max', 'T_min', 'R_a'],
+}
+
+# Function to calculate the slope of the saturation vapor pressure curve (Delta, mbar/°C)
+def slope_of_saturation_curve(T_mean):
+    return 2.00 * np.power((0.00738 * T_mean) + 0.8072, 7) - 0.00116
+
+# Function to calculate the saturation vapor pressure (e_s, mbar)
+def saturation_vapor_pressure(T_mean):
+    return 33.8639 * ((np.power(0.00738 * T_mean + 0.8072, 8)) - (0.000019 * ((1.8 * T_mean) + 48)) + 0.001316)
+
+# Lookup tables of the temperature-only terms of the ET methods
+class TemperatureTables:
+    """
+    Precomputed tables of Delta and e_s on a fine temperature grid, for a faster ET batch.
+
+    Values are linearly interpolated between grid points. Both terms are powers of
+    (0.00738*T + 0.8072), so their second derivatives grow with temperature and the
+    interpolation error on each grid interval is bounded by step^2/8 times the second
+    derivative at its upper end. max_relative_error holds the largest such bound over
+    the table (plus a margin for floating-point rounding) relative to the exact term.
+    Temperatures outside the table range (or NaN) are evaluated exactly.
+
+    The latent heat L is linear in temperature, so it is always evaluated exactly.
+
+    Parameters:
+    - t_min: Lowest temperature of the table (°C)
+    - t_max: Highest temperature of the table (°C)
+    - step: Spacing of the temperature grid (°C)
+
+    Attributes:
+    - max_relative_error: Dictionary with the guaranteed maximum relative error of
+      'Delta' and 'e_s' within the table range
+    """
+
+    # Terms in the tables: exact function, coefficient a and power n of a*(0.00738*T + 0.8072)^n
+    TERMS = {
+        'Delta': (slope_of_saturation_curve, 2.00, 7),
+        'e_s': (saturation_vapor_pressure, 33.8639, 8),
+    }
+
+    def __init__(self, t_min=-30.0, t_max=60.0, step=0.01):
+        self.t_min = float(t_min)
+        self.step = float(step)
+        self.size = int(round((t_max - t_min) / step)) + 1
+        grid = self.t_min + self.step * np.arange(self.size)
+        self.t_max = grid[-1]
+
+        self.tables = {}
+        self.slopes = {}
+        self.max_relative_error = {}
+        x = 0.00738 * grid + 0.8072
+        for name, (function, a, n) in self.TERMS.items():
+            values = function(grid)
+            if x[0] <= 0 or values.min() <= 0:
+                raise ValueError(f"Temperature tables cannot start as low as {t_min} °C")
+            self.tables[name] = values
+            self.slopes[name] = np.diff(values)
+            # Interpolation error bound on each interval, relative to the smallest value on it
+            second_derivative = a * n * (n - 1) * 0.00738**2 * x[1:]**(n - 2)
+            bound = self.step**2 / 8 * second_derivative / values[:-1]
+            self.max_relative_error[name] = float(bound.max() + 8 * np.finfo(float).eps)
+
+    def position(self, T_mean):
+        """
+        Returns the grid interval and the fraction within it of each temperature.
+
+        Returns:
+        - index: Index of the grid interval of each temperature (0 outside the table)
+        - fraction: Position within the interval, from 0 to 1
+        - inside: Boolean array, True for temperatures within the table range
+        """
+        x = (np.asarray(T_mean, dtype=float) - self.t_min) / self.step
+        inside = (x >= 0) & (x < self.size - 1)
+        index = np.where(inside, x, 0).astype(np.intp)
+        return index, x - index, inside
+
+    def lookup(self, name, T_mean, position=None):
+        """
+        Interpolates a term ('Delta' or 'e_s') from its table, evaluating it exactly outside the table.
+
+        Parameters:
+        - name: Name of the term
+        - T_mean: Mean temperature (°C), as a scalar or an array
+        - position: Result of position(T_mean), to share it between terms
+
+        Returns:
+        - Term for each temperature, with the shape of T_mean
+        """
+        index, fraction, inside = self.position(T_mean) if position is None else position
+        T_mean = np.asarray(T_mean, dtype=float)
+        # Work on 1-d arrays so that a scalar temperature can be assigned to as well
+        values = np.atleast_1d(np.take(self.tables[name], index))
+        values += np.atleast_1d(fraction * np.take(self.slopes[name], index))
+        if not np.all(inside):
+            outside = ~np.atleast_1d(inside)
+            values[outside] = self.TERMS[name][0](np.atleast_1d(T_mean)[outside])
+        return values.reshape(T_mean.shape)[()]
+
+# Columns of the station table and of the time-varying records of station_et_batch;
+# the station table may also hold the station 'latitude' (degrees)
+STATION_COLUMNS = ['station', 'E', 'z', 'U_day_night']
+STATION_RECORD_COLUMNS = ['station', 'T_max', 'T_min', 'RH_mean', 'U_z', 'R_s', 'R_n']
+
+# Station metadata looked up from the station table for each record
+STATION_METADATA = ['E', 'z', 'U_day_night', 'latitude']
+
+# Station metadata and the terms of the ET methods that depend only on it
+class StationTable:
+    """
+    Metadata of climate stations, with the ET terms that depend only on the station.
+
+    Elevation-only and height-only terms (the atmospheric pressure P and the wind
+    height factor (2/z)^0.2) are computed once per station and shared by all of its
+    records.
+
+    Parameters:
+    - station: Array of unique station ids
+    - E: Array of station elevations (m)
+    - z: Array of anemometer heights (m)
+    - U_day_night: Array of day to night wind ratios
+    - latitude: Array of station latitudes (degrees), needed only to derive the
+      extraterrestrial radiation of Hargreaves-Samani from record dates
+    """
+
+    def __init__(self, station, E, z, U_day_night, latitude=None):
+        self.station = np.asarray(station)
+        self.E = np.asarray(E, dtype=float)
+        self.z = np.asarray(z, dtype=float)
+        self.U_day_night = np.asarray(U_day_night, dtype=float)
+        self.latitude = np.full(len(self.station), np.nan) if latitude is None else np.asarray(latitude, dtype=float)
+        self._order = np.argsort(self.station, kind='stable')
+        self._sorted = self.station[self._order]
+        if len(self._sorted) > 1 and (self._sorted[1:] == self._sorted[:-1]).any():
+            raise ValueError("Station ids must be unique")
+
+    @classmethod
+    def from_frame(cls, data):
+        """Builds the station table from a DataFrame or dictionary with the STATION_COLUMNS (and 'latitude')."""
+        return cls(*(data[column] for column in STATION_COLUMNS), latitude=data['latitude'] if 'latitude' in data else None)
+
+    @classmethod
+    def split_records(cls, data, station='station'):
+        """
+        Separates per-record climate data into a station table and time-varying records.
+
+        Sheets such as Kharif repeat E, z and U_day_night (and 'latitude', if present)
+        on every record; these are reduced to one row per station.
+
+        Parameters:
+        - data: pandas DataFrame with the station metadata on every record
+        - station: Name of the station id column; without that column all records
+          belong to one station with this id
+
+        Returns:
+        - stations: StationTable with one row per station
+        - records: DataFrame of the time-varying columns, with a categorical 'station'
+          column (and the record's other columns, such as 'date' or 'Month')
+
+        Raises:
+        - ValueError: If the metadata of a station differs between its records
+        """
+        import pandas as pd  # Loaded lazily, only when a table is split
+
+        metadata = [column for column in STATION_METADATA if column in data]
+        ids = data[station] if station in data else pd.Series(station, index=data.index)
+        ids = pd.Categorical(ids)
+        table = pd.DataFrame({'station': ids, **{column: data[column].to_numpy() for column in metadata}})
+        grouped = table.groupby('station', observed=True, sort=False)
+        if (grouped[metadata].nunique(dropna=False) > 1).any().any():
+            raise ValueError("Station metadata differs between records of the same station")
+        first = grouped[metadata].first()
+        stations = cls(
+            np.asarray(first.index), *(first[column] for column in STATION_COLUMNS[1:]),
+            latitude=first['latitude'] if 'latitude' in first else None,
+        )
+        records = data.drop(columns=metadata + ([station] if station in data else []))
+        records.insert(0, 'station', ids)
+        return stations, records
+
+    def __len__(self):
+        return len(self.station)
+
+    @functools.cached_property
+    def P(self):
+        # Atmospheric pressure (P) at the elevation of each station
+        return 1013 - (0.1055 * self.E)
+
+    @functools.cached_property
+    def wind_height_factor(self):
+        # Factor converting wind speed at the anemometer height to the 2m height
+        return np.power(2 / self.z, 0.2)
+
+    def index_of(self, station):
+        """
+        Returns the position in the table of each station id.
+
+        Raises:
+        - KeyError: If a station id is not in the table
+        """
+        if hasattr(station, 'cat'):
+            # Categorical pandas column: look up each category once and expand by the codes
+            codes = station.cat.codes.to_numpy()
+            if (codes < 0).any():
+                raise KeyError('Record without a station id')
+            return self.index_of(np.asarray(station.cat.categories))[codes]
+        station = np.asarray(station)
+        position = np.minimum(np.searchsorted(self._sorted, station), len(self._sorted) - 1)
+        found = self._sorted[position] == station
+        if not found.all():
+            raise KeyError(station[~found][0])
+        return self._order[position]
+
+# Intermediate terms of the ET methods for a batch of records
+class ETTerms:
+    """
+    Intermediate terms shared by the ET methods, evaluated as arrays for a batch of records.
+
+    Each term is computed the first time a method needs it and then reused, so
+    requesting several methods for the same inputs evaluates terms such as the
+    saturation vapor pressure (e_s), the slope Delta, the psychrometric constant
+    Gamma and the wind speed at 2 m (U_2) only once. e_s and e_a are evaluated at
+    T_mean, as in the Modified Penman Method; e_s_daily and e_a_daily average the
+    saturation vapor pressure at T_max and T_min, as FAO-56 Penman-Monteith does. Terms are in the units of
+    modified_penman_method (mbar, km/day).
+
+    Parameters:
+    - data: pandas DataFrame or dictionary holding the input columns of the methods
+      (see METHOD_COLUMNS), each given as an array (or scalar)
+    - tables: Optional TemperatureTables to interpolate Delta and e_s from instead of
+      evaluating their polynomials
+    - stations: Optional StationTable; the records then carry a 'station' column
+      instead of E, z and U_day_night, and station-only terms are computed per station
+    """
+
+    def __init__(self, data, tables=None, stations=None):
+        self.data = data
+        self.tables = tables
+        self.stations = stations
+
+    def column(self, name):
+        """Returns an input column as a float array."""
+        if self.stations is not None and name in STATION_METADATA:
+            return getattr(self.stations, name)[self.station_index]
+        if name == 'R_a' and 'R_a' not in self.data and self.stations is not None and 'date' in self.data:
+            # Extraterrestrial radiation from the station latitude and the record date
+            dates = np.asarray(self.data['date'], dtype='datetime64[D]')
+            day_of_year = (dates - dates.astype('datetime64[Y]')).astype(int) + 1
+            return extraterrestrial_radiation(self.column('latitude'), day_of_year)
+        return np.asarray(self.data[name], dtype=float)
+
+    @functools.cached_property
+    def station_index(self):
+        # Position in the station table of the station of each record
+        return self.stations.index_of(self.data['station'])
+
+    @functools.cached_property
+    def T_max(self):
+        return self.column('T_max')
+
+    @functools.cached_property
+    def T_min(self):
+        return self.column('T_min')
+
+    @functools.cached_property
+    def RH_mean(self):
+        return self.column('RH_mean')
+
+    @functools.cached_property
+    def T_mean(self):
+        # Calculate the average temperature
+        return (self.T_max + self.T_min) / 2
+
+    @functools.cached_property
+    def U_2(self):
+        # Calculate wind speed at the 2m height (U_2)
+        if self.stations is not None:
+            return self.column('U_z') * self.stations.wind_height_factor[self.station_index]
+        return self.column('U_z') * np.power(2 / self.column('z'), 0.2)
+
+    @functools.cached_property
+    def _table_position(self):
+        return self.tables.position(self.T_mean)
+
+    @functools.cached_property
+    def Delta(self):
+        # Delta is the slope of the saturation vapor pressure curve
+        if self.tables is not None:
+            return self.tables.lookup('Delta', self.T_mean, self._table_position)
+        return slope_of_saturation_curve(self.T_mean)
+
+    @functools.cached_property
+    def P(self):
+        # Atmospheric pressure (P) at the given elevation
+        if self.stations is not None:
+            return self.stations.P[self.station_index]
+        return 1013 - (0.1055 * self.column('E'))
+
+    @functools.cached_property
+    def L(self):
+        # Latent heat of vaporization (L) as a function of temperature
+        return 2500.78 - (2.3601 * self.T_mean)
+
+    @functools.cached_property
+    def Gamma(self):
+        # Psychrometric constant (Gamma)
+        return 1.6134 * (self.P / self.L)
+
+    @functools.cached_property
+    def e_s(self):
+        # Calculate the saturation vapor pressure (e_s)
+        if self.tables is not None:
+            return self.tables.lookup('e_s', self.T_mean, self._table_position)
+        return saturation_vapor_pressure(self.T_mean)
+
+    @functools.cached_property
+    def e_a(self):
+        # Calculate the actual vapor pressure (e_a) using relative humidity
+        return self.e_s * (self.RH_mean / 100)
+
+    def _saturation_vapor_pressure(self, T):
+        if self.tables is not None:
+            return self.tables.lookup('e_s', T)
+        return saturation_vapor_pressure(T)
+
+    @functools.cached_property
+    def e_s_daily(self):
+        # Mean of the saturation vapor pressures at T_max and T_min (FAO-56 eq. 12),
+        # which e_s at T_mean underestimates
+        return (self._saturation_vapor_pressure(self.T_max) + self._saturation_vapor_pressure(self.T_min)) / 2
+
+    @functools.cached_property
+    def e_a_daily(self):
+        # Actual vapor pressure from the mean relative humidity (FAO-56 eq. 19)
+        return self.e_s_daily * (self.RH_mean / 100)
+
+# Function to evaluate the Modified Penman (FAO-24) method from shared terms
+def _modified_penman(terms):
+    U_day_night = terms.column('U_day_night')
+    RH_mean = terms.RH_mean
+
+    # Adjust wind speed for day-night ratio
+    U_2day = (U_day_night / (U_day_night + 1)) * terms.U_2 * (1000/43200)
+
+    # Coefficients used in the modified Penman equation
+    C1 = terms.Delta / (terms.Delta + terms.Gamma)
+    C2 = 1 - C1
+
+    # Adjust solar radiation (R_s) from cal/cm^2/day to mm/day
+    R_s = (terms.column('R_s') * 41868) / (terms.L * 1000)
+
+    # Calculate the adjustment factor (c) of the modified Penman method
+    c = 0.68 + (0.0028 * RH_mean) + (0.018 * R_s) - (0.068 * U_2day) + (0.013 * U_day_night) + (0.0097 * U_2day * U_day_night) + ((0.43*10**-4) * RH_mean * R_s * U_2day)
+
+    # Calculate the Evapotranspiration (ET) for every record
+    return c * ((C1 * terms.column('R_n')) + (C2 * 0.27 * (1.0 + (0.01 * terms.U_2)) * (terms.e_s - terms.e_a)))
+
+# Function to evaluate the FAO-56 Penman-Monteith method from shared terms
+def _penman_monteith(terms):
+    # Convert the shared terms to the units of FAO-56: kPa, m/s and MJ/m^2/day
+    Delta = 0.1 * terms.Delta
+    Gamma = 0.1 * terms.Gamma
+    U_2 = terms.U_2 * (1000/86400)
+    R_n = terms.column('R_n') * terms.L / 1000  # Evaporation equivalent (mm/day) to energy
+    G = 0  # Soil heat flux is neglected for daily and monthly steps
+
+    numerator = 0.408 * Delta * (R_n - G) + Gamma * (900 / (terms.T_mean + 273)) * U_2 * (0.1 * (terms.e_s_daily - terms.e_a_daily))
+    return numerator / (Delta + Gamma * (1 + 0.34 * U_2))
+
+# Function to evaluate the Hargreaves-Samani method from shared terms
+def _hargreaves_samani(terms):
+    # R_a is the extraterrestrial radiation (mm/day), see extraterrestrial_radiation
+    return 0.0023 * (terms.T_mean + 17.8) * np.sqrt(terms.T_max - terms.T_min) * terms.column('R_a')
+
+# Reference ET methods of reference_et_batch
+ET_METHODS = {
+    'modified_penman': _modified_penman,
+    'penman_monteith': _penman_monteith,
+    'hargreaves_samani': _hargreaves_samani,
+}
+
+# Function to calculate reference ET with one or several methods for many records
+def reference_et_batch(data, methods='modified_penman', tables=None):
+    """
+    Calculate reference Evapotranspiration (ET) for many records with one or several methods.
+
+    Available methods (see METHOD_COLUMNS for the columns each one needs):
+    - 'modified_penman': Modified Penman Method (FAO-24), as modified_penman_method
+    - 'penman_monteith': FAO-56 Penman-Monteith, with R_n in mm/day and soil heat flux neglected
+    - 'hargreaves_samani': Hargreaves-Samani, from temperature and extraterrestrial radiation R_a (mm/day)
+
+    Intermediate terms shared by the methods are evaluated once per call (see ETTerms).
+
+    Parameters:
+    - data: pandas DataFrame or dictionary holding the input columns of the methods
+    - methods: Name of one method, or a list of method names
+    - tables: Optional TemperatureTables for interpolated Delta and e_s (within
+      tables.max_relative_error of the exact terms)
+
+    Returns:
+    - ET: NumPy array of estimated Evapotranspiration (mm/day) for one method, or a
+      dictionary mapping each method name to its array
+    """
+    terms = ETTerms(data, tables)
+    if isinstance(methods, str):
+        return ET_METHODS[methods](terms)
+    return {method: ET_METHODS[method](terms) for method in methods}
+
+def modified_penman_batch(data, tables=None):
+    """
+    Calculate Evapotranspiration (ET) for many records at once using the Modified Penman Method.
+
+    Every intermediate term is evaluated as an array expression in the same order as
+    modified_penman_method, which stays the scalar reference. Results agree with the
+    scalar function to within floating-point rounding (NumPy's vectorized power may
+    differ from math.pow in the last bit).
+
+    Parameters:
+    - data: pandas DataFrame or dictionary holding the columns listed in PENMAN_COLUMNS,
+      each given as an array (or scalar) of values in the units of modified_penman_method
+    - tables: Optional TemperatureTables for interpolated Delta and e_s (within
+      tables.max_relative_error of the exact terms)
+
+    Returns:
+    - ET: NumPy array of estimated Evapotranspiration (mm/day), one value per record
+    """
+    return _modified_penman(ETTerms(data, tables))
+
+# Function to round ET results to 2 decimal places for output
+def round_et(et):
+    """
+    Rounds ET values to 2 decimal places the way the Excel output of ETr does.
+
+    Each value is rounded as a Python float with round(value, 2); numpy.round
+    scales by 100 before rounding and so would round e.g. 2.745 down to 2.74.
+
+    Parameters:
+    - et: Array of ET values (mm/day)
+
+    Returns:
+    - NumPy array of ET values rounded to 2 decimal places
+    """
+    return np.array([round(value, 2) for value in np.asarray(et, dtype=float).tolist()], dtype=float)
+
+# Function to calculate reference ET for records of many stations
+def station_et_batch(records, stations, methods='modified_penman', tables=None):
+    """
+    Calculate reference Evapotranspiration (ET) for records of many stations.
+
+    Station metadata (E, z, U_day_night, latitude) comes from the station table
+    instead of being repeated on every record, and the terms that depend only on it
+    are computed once per station (see StationTable). The two tables are not merged:
+    each station term is looked up by the station index of the records. Records with
+    a 'date' column get the extraterrestrial radiation of Hargreaves-Samani from the
+    station latitude when they have no 'R_a' column.
+
+    Parameters:
+    - records: pandas DataFrame or dictionary with the STATION_RECORD_COLUMNS
+      (columns of other methods as needed, see METHOD_COLUMNS); a categorical
+      'station' column is matched to the station table fastest
+    - stations: StationTable, or a DataFrame or dictionary with the STATION_COLUMNS
+    - methods: Name of one method, or a list of method names (see reference_et_batch)
+    - tables: Optional TemperatureTables for interpolated Delta and e_s
+
+    Returns:
+    - ET: NumPy array of estimated Evapotranspiration (mm/day) for one method, or a
+      dictionary mapping each method name to its array
+    """
+    if not isinstance(stations, StationTable):
+        stations = StationTable.from_frame(stations)
+    terms = ETTerms(records, tables, stations)
+    if isinstance(methods, str):
+        return ET_METHODS[methods](terms)
+    return {method: ET_METHODS[method](terms) for method in methods}
+
+# Function to calculate the extraterrestrial radiation used by Hargreaves-Samani
+def extraterrestrial_radiation(latitude, day_of_year):
+    """
+    Calculates the daily extraterrestrial radiation (R_a) following FAO-56 (eq. 21).
+
+    Parameters:
+    - latitude: Latitude (degrees, negative in the southern hemisphere)
+    - day_of_year: Day of the year (1 to 366)
+
+    Returns:
+    - R_a: Extraterrestrial radiation expressed as evaporation equivalent (mm/day)
+    """
+    phi = np.radians(np.asarray(latitude, dtype=float))
+    J = np.asarray(day_of_year, dtype=float)
+    d_r = 1 + 0.033 * np.cos(2 * np.pi / 365 * J)  # Inverse relative Earth-Sun distance
+    delta = 0.409 * np.sin(2 * np.pi / 365 * J - 1.39)  # Solar declination
+    omega_s = np.arccos(np.clip(-np.tan(phi) * np.tan(delta), -1, 1))  # Sunset hour angle
+    R_a = (24 * 60 / np.pi) * 0.0820 * d_r * (omega_s * np.sin(phi) * np.sin(delta) + np.cos(phi) * np.cos(delta) * np.sin(omega_s))
+    return 0.408 * R_a  # Convert MJ/m^2/day to mm/day
@@ -0,0 +1,197 @@
+"""
+Excel input and output for the irrigation tools.
+
+pandas and openpyxl are imported inside the functions that need them, so
+importing the irrigation package stays cheap for code that only computes.
+"""
+# Import necessary libraries
+from collections import namedtuple  # For the tables returned by the workbook loader
+
+from irrigation import cache  # Binary sidecar cache of parsed sheets
+
+# Column types of the sheets used for irrigation scheduling
+SHEET_DTYPES = {
+    'Soil': {'soil_type': str, 'field_capacity': float, 'wilting_point': float},
+    'Crops': {
+        'crop_type': str, 'root_depth': float,
+        'initial_kc': float, 'initial_days': int,
+        'development_kc': float, 'development_days': int,
+        'mid_season_kc': float, 'mid_season_days': int,
+        'late_season_kc': float, 'late_season_days': int,
+    },
+    'Climate': {'ETr': float},
+    'Rainfall': {'Rainfall (mm)': float},
+}
+
+# Tables of the scheduling workbook, one DataFrame per sheet
+SchedulingWorkbook = namedtuple('SchedulingWorkbook', ['soil', 'crops', 'climate', 'rainfall'])
+
+
+# Function to read several sheets of an Excel workbook into DataFrames
+def read_sheets(file_path, sheet_names, cache_dir=None, use_cache=True):
+    """
+    Reads sheets of an Excel workbook into pandas DataFrames.
+
+    Sheets are taken from the binary sidecar cache (see irrigation.cache) while the
+    workbook is unchanged; the remaining sheets are read from a single parse of the
+    workbook and added to the cache.
+
+    Parameters:
+    - file_path: Path to the Excel workbook
+    - sheet_names: Names of the sheets to read
+    - cache_dir: Directory for cached sheets (default: next to the workbook)
+    - use_cache: Whether to read and write the sidecar cache
+
+    Returns:
+    - Dictionary mapping each sheet name to a DataFrame with its contents
+
+    Raises:
+    - KeyError: If a sheet is not found in the workbook
+    """
+    sheets, workbook_sheet_names = {}, None
+    if use_cache:
+        sheets, workbook_sheet_names = cache.read_cached_sheets(file_path, sheet_names, cache_dir)
+
+    missing = [sheet_name for sheet_name in sheet_names if sheet_name not in sheets]
+    if missing:
+        import pandas as pd  # Loaded lazily, only when Excel input is requested
+
+        with pd.ExcelFile(file_path) as workbook:
+            for sheet_name in missing:
+                if sheet_name not in workbook.sheet_names:
+                    raise KeyError(sheet_name)
+            parsed = pd.read_excel(workbook, sheet_name=missing)
+            workbook_sheet_names = workbook.sheet_names
+        if use_cache:
+            cache.write_cached_sheets(file_path, parsed, workbook_sheet_names, cache_dir)
+        sheets.update(parsed)
+    return {sheet_name: sheets[sheet_name] for sheet_name in sheet_names}
+
+# Function to read one sheet of an Excel workbook into a DataFrame
+def read_sheet(file_path, sheet_name, cache_dir=None, use_cache=True):
+    """
+    Reads a sheet of an Excel workbook into a pandas DataFrame.
+
+    Parameters:
+    - file_path: Path to the Excel workbook
+    - sheet_name: Name of the sheet to read
+    - cache_dir: Directory for cached sheets (default: next to the workbook)
+    - use_cache: Whether to read and write the sidecar cache
+
+    Returns:
+    - DataFrame with the contents of the sheet
+    """
+    return read_sheets(file_path, [sheet_name], cache_dir, use_cache)[sheet_name]
+
+# Function to read the Soil, Crops, Climate and Rainfall sheets in a single pass
+def load_scheduling_workbook(file_path, cache_dir=None, use_cache=True):
+    """
+    Reads all sheets needed for irrigation scheduling from one parse of the workbook.
+
+    The workbook archive is opened once and every sheet is read from it, instead
+    of re-opening the file for each sheet; unchanged workbooks are served from the
+    sidecar cache. The columns listed in SHEET_DTYPES are converted to their types
+    (e.g., growth stage days to integers).
+
+    Parameters:
+    - file_path: Path to the Excel workbook
+    - cache_dir: Directory for cached sheets (default: next to the workbook)
+    - use_cache: Whether to read and write the sidecar cache
+
+    Returns:
+    - SchedulingWorkbook with the soil, crops, climate and rainfall DataFrames
+
+    Raises:
+    - KeyError: If a sheet (e.g., 'Rainfall') or a column listed in SHEET_DTYPES is missing
+    """
+    sheets = read_sheets(file_path, list(SHEET_DTYPES), cache_dir, use_cache)
+
+    # Convert the known columns of each sheet to their types
+    for sheet_name, dtypes in SHEET_DTYPES.items():
+        sheet = sheets[sheet_name]
+        for column, dtype in dtypes.items():
+            sheet[column] = sheet[column].astype(dtype)
+    return SchedulingWorkbook(sheets['Soil'], sheets['Crops'], sheets['Climate'], sheets['Rainfall'])
+
+# Function to save the ETr results to an Excel workbook
+def write_etr(months, etr, output_file_path):
+    """
+    Saves monthly ETr results to an Excel workbook.
+
+    Parameters:
+    - months: Sequence of month names
+    - etr: Sequence of ETr values (mm/day), one per month
+    - output_file_path: Path of the Excel workbook to write
+    """
+    import pandas as pd  # Loaded lazily, only when Excel output is requested
+
+    # Create a new DataFrame to store the calculated ET results alongside the month names
+    et_df = pd.DataFrame({
+        'Month': months,  # Month column from the input data
+        'ETr': etr  # Estimated evapotranspiration results
+    })
+    et_df.to_excel(output_file_path, index=False)
+
+# Headers of the irrigation schedule sheet
+SCHEDULE_HEADERS = ['Day', 'Growing Season', 'Growth Stage', 'Crop Type', 'Kc', 'ETo (mm/day)', 'Crop water use (Etc) (mm/day)', 'Rainfall (mm)', 'Net Irrigation application (mm)', 'Cumulative soil water deficit (mm)', 'Irrigation Required']
+
+# Function to round a value to 2 decimal places
+def _round2(value):
+    # Convert NumPy scalars to Python floats first: numpy.round scales by 100
+    # before rounding and so rounds e.g. 2.745 down to 2.74
+    return round(float(value), 2)
+
+# Function to save an irrigation schedule to an Excel workbook
+def write_schedule(schedule, output_file):
+    """
+    Saves a daily irrigation schedule to an Excel workbook with a bold header row.
+
+    The workbook is written in openpyxl's write-only mode and rows are streamed
+    straight from the schedule records, so memory use does not grow with the
+    number of rows.
+
+    Parameters:
+    - schedule: ScheduleResult from daily_irrigation_schedule, or any iterable of daily
+      irrigation schedule records
+    - output_file: Path of the Excel workbook to write
+    """
+    from openpyxl import Workbook  # For writing data to Excel with formatting
+    from openpyxl.cell import WriteOnlyCell  # For styled cells in write-only mode
+    from openpyxl.styles import Font  # For styling Excel headers
+
+    # Set up a write-only workbook and worksheet for output
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+
+    # Schedules built from dated daily data get a Date column after the Day
+    dated = getattr(schedule, 'date', None) is not None
+    headers = SCHEDULE_HEADERS[:1] + ['Date'] + SCHEDULE_HEADERS[1:] if dated else SCHEDULE_HEADERS
+
+    # Write the headers to the Excel sheet in bold
+    header_font = Font(bold=True)
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = header_font
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    # Stream the irrigation schedule records starting from row 2
+    for row in schedule:
+        ws.append([
+            row['day'],
+            *([row['date']] if dated else []),
+            row['growing_season'],
+            row['growth_stage'],
+            row['crop_type'],
+            row['kc'],
+            _round2(row['ETo (mm/day)']),  # Round values to 2 decimal places
+            _round2(row['Crop water use (Etc) (mm/day)']),
+            _round2(row['Rainfall (mm)']),
+            _round2(row['Net Irrigation application (mm)']),
+            _round2(row['Cumulative soil water deficit (mm)']),
+            row['Irrigation Required']
+        ])
+
+    # Save the workbook to the output file
+    wb.save(output_file)
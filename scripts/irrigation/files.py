@@ -0,0 +1,27 @@
+"""
+Helpers for replacing output files atomically.
+
+Files such as the sheet cache, the ETr store and the field checkpoints are
+written to a temporary file next to their final path and then moved into
+place with os.replace, so readers never see a partly written file.
+"""
+# Import necessary libraries
+import os  # For the process id
+import uuid  # For unique temporary file names
+
+
+# Function to name a temporary file next to an output file
+def temporary_path(path):
+    """
+    Returns a temporary file name next to a file, unique per process and call.
+
+    Processes writing the same file at once each get their own temporary file,
+    so they never interleave their writes before os.replace moves it into place.
+
+    Parameters:
+    - path: Path of the file to replace
+
+    Returns:
+    - Path of a temporary file in the same directory
+    """
+    return f"{path}.{os.getpid()}-{uuid.uuid4().hex}.tmp"
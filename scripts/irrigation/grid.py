@@ -0,0 +1,69 @@
+"""
+Gridded (raster) reference evapotranspiration.
+
+gridded_etr applies the Modified Penman Method to climate grids stored as
+(time x lat x lon) .npy stacks. Inputs are opened as memory maps and processed
+in blocks sized to a memory budget, and ETr is written block by block to an
+output .npy memory map, so grids much larger than RAM can be processed.
+"""
+# Import necessary libraries
+import numpy as np  # For memory-mapped arrays
+
+from irrigation.et import PENMAN_COLUMNS, modified_penman_batch
+
+# Approximate bytes held per grid cell while a block is computed: the input
+# columns plus the intermediate terms of modified_penman_batch, as float64
+BYTES_PER_CELL = 8 * 32
+
+
+# Function to open one gridded input variable
+def _open_input(source):
+    if isinstance(source, str) or hasattr(source, '__fspath__'):
+        source = np.load(source, mmap_mode='r')
+    if not isinstance(source, np.ndarray):
+        source = np.asarray(source, dtype=float)
+    if source.ndim > 3:
+        raise ValueError(f"Gridded inputs must have at most 3 dimensions (time x lat x lon), got shape {source.shape}")
+    # Align lower-dimensional inputs (e.g., elevation as lat x lon) to the last axes
+    return source.reshape((1,) * (3 - source.ndim) + source.shape)
+
+# Function to take a block of an input, broadcasting axes of length 1
+def _block(source, times, rows):
+    return source[times if source.shape[0] > 1 else slice(None), rows if source.shape[1] > 1 else slice(None)]
+
+# Function to calculate ETr over a climate grid in memory-bounded blocks
+def gridded_etr(inputs, output_path, memory_budget=256 * 2**20, dtype=np.float32):
+    """
+    Calculate Evapotranspiration (ET) over a (time x lat x lon) grid with the Modified Penman Method.
+
+    Parameters:
+    - inputs: Dictionary mapping each name in PENMAN_COLUMNS to a path of a .npy file,
+      an array or a scalar. Arrays must broadcast to (time x lat x lon) when aligned to
+      the last axes, e.g. elevation 'E' as (lat x lon) and 'z' as a single value.
+    - output_path: Path of the .npy file to write ETr (mm/day) to
+    - memory_budget: Approximate memory (bytes) used for the block being computed
+    - dtype: Data type of the output grid
+
+    Returns:
+    - ET: Memory-mapped array (time x lat x lon) of estimated Evapotranspiration (mm/day)
+    """
+    sources = {column: _open_input(inputs[column]) for column in PENMAN_COLUMNS}
+    shape = np.broadcast_shapes(*(source.shape for source in sources.values()))
+    times, lats, lons = shape
+    output = np.lib.format.open_memmap(output_path, mode='w+', dtype=dtype, shape=shape)
+
+    # Use whole time steps per block when they fit in the budget, otherwise rows of one time step
+    cells = max(1, memory_budget // BYTES_PER_CELL)
+    if lats * lons <= cells:
+        time_block, row_block = max(1, cells // (lats * lons)), lats
+    else:
+        time_block, row_block = 1, max(1, cells // lons)
+
+    for t0 in range(0, times, time_block):
+        block_times = slice(t0, min(t0 + time_block, times))
+        for y0 in range(0, lats, row_block):
+            block_rows = slice(y0, min(y0 + row_block, lats))
+            block = {column: _block(source, block_times, block_rows) for column, source in sources.items()}
+            output[block_times, block_rows] = modified_penman_batch(block)
+        output.flush()
+    return output
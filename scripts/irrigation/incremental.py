@@ -0,0 +1,96 @@
+"""
+Incremental ETr recomputation.
+
+incremental_etr keeps a Parquet store of computed ETr together with a content
+hash of the input columns of each record, keyed by columns such as station
+and date. On a rerun only records whose key is new or whose inputs changed
+are computed again; the results are merged into the store, which also keeps
+records that are no longer part of the input. ETr is rounded to 2 decimal
+places like the Excel output.
+"""
+# Import necessary libraries
+import os  # For replacing the store atomically
+
+import numpy as np  # For the masks of new and changed records
+
+from irrigation.et import METHOD_COLUMNS, reference_et_batch, round_et
+from irrigation.files import temporary_path
+
+# Name of the column holding the content hash of each record in the store
+HASH_COLUMN = '_row_hash'
+
+
+# Function to compute the content hash of the input columns of each record
+def row_hashes(records, columns):
+    """
+    Returns a 64-bit content hash of the given columns of each record.
+
+    Parameters:
+    - records: pandas DataFrame of records
+    - columns: Names of the columns to hash
+
+    Returns:
+    - NumPy array of uint64 hashes, one per record
+    """
+    import pandas as pd  # Loaded lazily, only when records are hashed
+
+    return pd.util.hash_pandas_object(records[list(columns)], index=False).to_numpy()
+
+# Function to update ETr for the new and changed records only
+def incremental_etr(records, store_path, key_columns=('station', 'date'), method='modified_penman'):
+    """
+    Calculates reference ET for new or modified records and merges it into a Parquet store.
+
+    Parameters:
+    - records: pandas DataFrame with the key columns and the input columns of the method
+    - store_path: Path of the Parquet store of keys, input hashes and ETr
+    - key_columns: Columns identifying a record (e.g., station and date)
+    - method: ET method (see reference_et_batch)
+
+    Returns:
+    - result: DataFrame of the key columns and 'ETr' (rounded to 2 decimals) of every input record
+    - recomputed: Number of records whose ETr was computed in this run
+
+    Raises:
+    - ValueError: If a key occurs more than once in the records
+    """
+    import pandas as pd  # Loaded lazily, only when records are processed
+
+    key_columns = list(key_columns)
+    if records.duplicated(key_columns).any():
+        raise ValueError(f"Records must be unique by {key_columns}")
+
+    current = records[key_columns].copy()
+    current[HASH_COLUMN] = row_hashes(records, METHOD_COLUMNS[method])
+
+    if os.path.exists(store_path):
+        stored = pd.read_parquet(store_path)
+        # Position of each input key in the store (-1 for keys that are new)
+        positions = pd.MultiIndex.from_frame(stored[key_columns]).get_indexer(pd.MultiIndex.from_frame(current[key_columns]))
+        found = positions >= 0
+        changed = ~found
+        changed[found] = stored[HASH_COLUMN].to_numpy()[positions[found]] != current[HASH_COLUMN].to_numpy()[found]
+        etr = np.full(len(current), np.nan)
+        etr[found] = stored['ETr'].to_numpy(dtype=float)[positions[found]]
+    else:
+        stored = None
+        changed = np.ones(len(current), dtype=bool)
+        etr = np.full(len(current), np.nan)
+
+    # Compute ETr only for the records that are new or whose inputs changed
+    if changed.any():
+        etr[changed] = round_et(reference_et_batch(records.loc[changed], method))
+    current['ETr'] = etr
+
+    # Keep stored records that are not part of this input, then replace the store
+    if stored is not None:
+        kept = np.ones(len(stored), dtype=bool)
+        kept[positions[found]] = False
+        updated = pd.concat([stored[kept], current], ignore_index=True)
+    else:
+        updated = current
+    temporary_file = temporary_path(store_path)
+    updated.to_parquet(temporary_file, index=False)
+    os.replace(temporary_file, store_path)
+
+    return current[key_columns + ['ETr']], int(changed.sum())
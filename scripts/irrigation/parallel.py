@@ -0,0 +1,148 @@
+"""
+Shared-memory transport of arrays to parallel worker processes.
+
+SharedArrays copies a set of NumPy arrays into one multiprocessing shared
+memory block. Worker processes receive only its descriptor (the block name and
+the offset, shape and dtype of each array) and attach views to the same
+memory, so arrays are neither pickled per task nor copied per worker, and
+worker memory does not grow with the size of the inputs.
+
+modified_penman_parallel uses this to split a batch ET calculation over a
+process pool: inputs and the output array live in shared memory and each
+task is just a (start, stop) row range.
+"""
+# Import necessary libraries
+import concurrent.futures  # For the process pool
+import math  # For the chunk size
+import os  # For the number of processors
+from multiprocessing import shared_memory  # For memory shared between processes
+
+import numpy as np  # For the shared arrays
+
+from irrigation.et import PENMAN_COLUMNS, modified_penman_batch
+
+# Alignment (bytes) of each array within the shared memory block
+_ALIGNMENT = 64
+
+# Shared memory blocks attached by this process, kept open for the life of the worker
+_attached = []
+
+# Arrays attached by a worker process of modified_penman_parallel
+_worker_arrays = {}
+
+
+# Set of NumPy arrays copied into one shared memory block
+class SharedArrays:
+    """
+    Copies NumPy arrays into a single shared memory block owned by this process.
+
+    Use it as a context manager so the block is released when the work is done:
+
+        with SharedArrays({'etr': daily_etr}) as shared:
+            ... pass shared.descriptor to workers, which call attach_shared_arrays ...
+
+    Parameters:
+    - arrays: Dictionary mapping names to arrays to share
+    """
+
+    def __init__(self, arrays):
+        self.layout = {}
+        size = 0
+        for name, array in arrays.items():
+            array = np.asarray(array)
+            size = -(-size // _ALIGNMENT) * _ALIGNMENT
+            self.layout[name] = (size, array.shape, array.dtype.str)
+            size += array.nbytes
+        self.shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for name, array in arrays.items():
+            view = _view(self.shm, self.layout[name])
+            view[...] = array
+            del view  # Release the buffer so the block can be closed later
+
+    @property
+    def descriptor(self):
+        """Picklable description of the block, for attach_shared_arrays in a worker."""
+        return self.shm.name, self.layout
+
+    def copy(self, name):
+        """Returns a copy of a shared array that stays valid after the block is released."""
+        view = _view(self.shm, self.layout[name])
+        array = view.copy()
+        del view
+        return array
+
+    def close(self):
+        """Releases the shared memory block."""
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# Function to build a view of one array of a shared memory block
+def _view(shm, layout_entry):
+    offset, shape, dtype = layout_entry
+    return np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+
+# Function to attach to the arrays of a shared memory block in a worker process
+def attach_shared_arrays(descriptor, writable=()):
+    """
+    Attaches views to the arrays of a SharedArrays block created by another process.
+
+    Parameters:
+    - descriptor: SharedArrays.descriptor of the block
+    - writable: Names of the arrays the worker writes to; the others are read-only
+
+    Returns:
+    - Dictionary mapping names to arrays backed by the shared memory
+    """
+    name, layout = descriptor
+    shm = shared_memory.SharedMemory(name=name)
+    _attached.append(shm)
+    arrays = {}
+    for array_name, layout_entry in layout.items():
+        arrays[array_name] = _view(shm, layout_entry)
+        arrays[array_name].flags.writeable = array_name in writable
+    return arrays
+
+# Function to attach the shared ET inputs and output in a worker process
+def _init_penman_worker(descriptor):
+    _worker_arrays.update(attach_shared_arrays(descriptor, writable=('ET_r',)))
+
+# Function to calculate ET for a range of rows in a worker process
+def _penman_rows(row_range):
+    start, stop = row_range
+    _worker_arrays['ET_r'][start:stop] = modified_penman_batch(
+        {column: _worker_arrays[column][start:stop] for column in PENMAN_COLUMNS}
+    )
+
+# Function to calculate ET with the Modified Penman Method over a process pool
+def modified_penman_parallel(data, max_workers=None, chunk_rows=None):
+    """
+    Calculate Evapotranspiration (ET) for many records with a pool of worker processes.
+
+    The input columns and the output are placed in shared memory once; tasks only
+    carry row ranges. Results equal those of modified_penman_batch.
+
+    Parameters:
+    - data: pandas DataFrame or dictionary holding the columns listed in PENMAN_COLUMNS
+    - max_workers: Number of worker processes (default: number of processors)
+    - chunk_rows: Number of records per task (default: about four tasks per worker)
+
+    Returns:
+    - ET: NumPy array of estimated Evapotranspiration (mm/day), one value per record
+    """
+    columns = {column: np.asarray(data[column], dtype=float) for column in PENMAN_COLUMNS}
+    rows = len(columns[PENMAN_COLUMNS[0]])
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_rows = chunk_rows or max(1, math.ceil(rows / (4 * max_workers)))
+    row_ranges = [(start, min(start + chunk_rows, rows)) for start in range(0, rows, chunk_rows)]
+
+    with SharedArrays({**columns, 'ET_r': np.zeros(rows)}) as shared:
+        with concurrent.futures.ProcessPoolExecutor(max_workers, initializer=_init_penman_worker, initargs=(shared.descriptor,)) as executor:
+            for _ in executor.map(_penman_rows, row_ranges):
+                pass
+        return shared.copy('ET_r')
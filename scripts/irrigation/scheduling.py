@@ -0,0 +1,636 @@
+"""
+Daily irrigation scheduling from soil, crop and climatic data.
+
+The functions here work on plain dictionaries and lists so they can be used
+without pandas or openpyxl; Excel input and output live in irrigation.excel.
+"""
+# Import necessary libraries
+import datetime  # For date handling in interpolation
+import functools  # For caching the calendar axis of a season and the Kc curves
+import numpy as np  # For numerical operations, especially generating daily values from monthly data
+
+# Names of the crop growth stages and the column prefixes used for them in the Crops sheet
+GROWTH_STAGE_COLUMNS = {
+    'initial': 'initial',
+    'development': 'development',
+    'mid-season': 'mid_season',
+    'late-season': 'late_season',
+}
+
+# Function to build the growth stage table of a crop from a row of the Crops sheet
+def growth_stages(crop):
+    """
+    Builds the crop growth stages with their crop coefficient (kc) and duration.
+
+    Parameters:
+    - crop: Dictionary containing a row of the Crops sheet (e.g., initial_kc, initial_days)
+
+    Returns:
+    - growth_stages: Dictionary mapping each growth stage to its 'kc' and 'days'
+    """
+    return {
+        stage: {'kc': crop[f'{prefix}_kc'], 'days': crop[f'{prefix}_days']}
+        for stage, prefix in GROWTH_STAGE_COLUMNS.items()
+    }
+
+# Function to calculate crop evapotranspiration (ET) based on crop coefficient (kc) and reference ET (ETr)
+def calculate_et(crop_kc, etr):
+    """
+    Calculates the crop evapotranspiration (ETc) using the formula: ETc = ETr * kc
+    
+    Parameters:
+    - crop_kc: Crop coefficient for the current growth stage
+    - etr: Reference evapotranspiration (ETr) in mm/day
+    
+    Returns:
+    - ETc: Crop evapotranspiration (ETc) in mm/day
+    """
+    return etr * crop_kc
+
+# Shapes of the daily crop coefficient (Kc) curve: constant within each growth stage,
+# or FAO-56 (constant in the initial and mid-season stages, linear in between)
+KC_CURVES = ('stages', 'fao56')
+
+# Function to build the daily crop coefficient (Kc) of a whole season
+@functools.lru_cache(maxsize=1024)
+def crop_kc_curve(stage_kc, stage_days, kc_curve='stages'):
+    """
+    Builds the daily crop coefficient (Kc) of a season from its growth stages.
+
+    With kc_curve='fao56' the four stages (initial, development, mid-season,
+    late-season) follow the FAO-56 crop coefficient curve: Kc is the initial Kc
+    through the initial stage, rises linearly to the mid-season Kc by the last day
+    of the development stage, stays there through mid-season and falls linearly to
+    the late-season (end of season) Kc by the last day of the season. The
+    development stage Kc is not used. The result is read-only and cached for the
+    1024 most recently used crop parameters, so memory stays bounded when many
+    fields have their own calibrated parameters.
+
+    Parameters:
+    - stage_kc: Tuple of the crop coefficients of the growth stages
+    - stage_days: Tuple of the growth stage durations in days
+    - kc_curve: 'stages' (constant Kc in each stage) or 'fao56'
+
+    Returns:
+    - Array of the daily crop coefficient, one value per day of the season
+
+    Raises:
+    - ValueError: If kc_curve is unknown, or 'fao56' is used without four growth stages
+    """
+    stage_days = [int(days) for days in stage_days]
+    if kc_curve == 'stages':
+        kc = np.repeat(np.asarray(stage_kc, dtype=float), stage_days)
+    elif kc_curve == 'fao56':
+        if len(stage_kc) != 4:
+            raise ValueError(f"The FAO-56 Kc curve needs 4 growth stages, got {len(stage_kc)}")
+        kc_ini, _, kc_mid, kc_end = stage_kc
+        # Kc at the end of each stage, interpolated linearly on the day number (1 = first day)
+        stage_end = np.concatenate([[0], np.cumsum(stage_days)])
+        kc = np.interp(np.arange(1, stage_end[-1] + 1), stage_end, [kc_ini, kc_ini, kc_mid, kc_mid, kc_end])
+    else:
+        raise ValueError(f"Unknown Kc curve '{kc_curve}' (expected one of {', '.join(KC_CURVES)})")
+    kc.setflags(write=False)
+    return kc
+
+# Function to get the daily crop coefficient (Kc) of a crop
+def daily_kc_curve(crop, kc_curve='stages'):
+    """
+    Returns the cached daily crop coefficient (Kc) of a crop's season (see crop_kc_curve).
+
+    Parameters:
+    - crop: Dictionary containing crop properties (e.g., growth stages, crop coefficient)
+    - kc_curve: 'stages' (constant Kc in each stage) or 'fao56'
+
+    Returns:
+    - Read-only array of the daily crop coefficient, one value per day of the season
+    """
+    stages = crop['growth_stages'].values()
+    return crop_kc_curve(
+        tuple(float(properties['kc']) for properties in stages),
+        tuple(int(properties['days']) for properties in stages),
+        kc_curve,
+    )
+
+# Function to build the daily calendar axis of a growing season
+@functools.lru_cache(maxsize=None)
+def season_calendar(season_months, year=2024):
+    """
+    Builds the daily calendar axis used to interpolate monthly data over a season.
+
+    Each day of the season falls in the interval from the first day of one season
+    month to the first day of the next; the last month runs to the end of its year.
+    Seasons may cross the new year (e.g., Rabi, October to March). The result is
+    cached per season and year and its arrays are read-only.
+
+    Parameters:
+    - season_months: Tuple of integers representing months in the growing season
+    - year: Year in which the season starts, used for the month lengths
+
+    Returns:
+    - segment: Index of the month interval of each day of the season
+    - offset: Day of each day within its month interval, starting at 0
+    - segment_days: Number of days in each month interval
+    """
+    # First day of each season month; months after December fall in the next year (e.g., Rabi)
+    month_starts = []
+    month_year = year
+    for i, month in enumerate(season_months):
+        if i and month <= season_months[i - 1]:
+            month_year += 1
+        month_starts.append(datetime.date(month_year, month, 1))
+
+    segment_days = [(month_starts[i + 1] - month_starts[i]).days for i in range(len(season_months) - 1)]
+    # Handle the transition from the last month to the end of its year
+    segment_days.append((datetime.date(month_year, 12, 31) - month_starts[-1]).days + 1)
+
+    segment_days = np.array(segment_days)
+    segment = np.repeat(np.arange(len(segment_days)), segment_days)
+    # Days since the start of the interval each day falls in
+    offset = np.arange(len(segment)) - np.repeat(np.cumsum(segment_days) - segment_days, segment_days)
+    for array in (segment, offset, segment_days):
+        array.setflags(write=False)
+    return segment, offset, segment_days
+
+# Function to interpolate many monthly series to daily values at once
+def interpolate_monthly_to_daily_batch(monthly_data, season_months, year=2024):
+    """
+    Interpolates monthly series to daily values for the growing season using linear interpolation.
+
+    Within each month values run linearly from that month's value towards the
+    next month's value, and the last month runs towards the first month's value.
+    Results equal those of interpolate_monthly_to_daily for every series.
+
+    Parameters:
+    - monthly_data: Array of monthly data with one row per month, either 1-D for one
+      series or 2-D (months x series) for many series (e.g., ETr of many stations)
+    - season_months: List of integers representing months in the growing season
+    - year: Year in which the season starts, used for the month lengths
+
+    Returns:
+    - daily_data: Array of interpolated daily values, 1-D (days) or 2-D (days x series)
+    """
+    monthly_data = np.asarray(monthly_data, dtype=float)
+    segment, offset, segment_days = season_calendar(tuple(season_months), year)
+
+    # Start and end values of each month interval; the last month runs to the first month
+    months = len(season_months)
+    start = monthly_data[np.append(np.arange(months - 1), len(monthly_data) - 1)]
+    end = monthly_data[np.append(np.arange(1, months), 0)]
+    step = (end - start) / segment_days.reshape((-1,) + (1,) * (monthly_data.ndim - 1))
+
+    # Same arithmetic as np.linspace(start, end, days, endpoint=False) for each interval
+    return offset.reshape((-1,) + (1,) * (monthly_data.ndim - 1)) * step[segment] + start[segment]
+
+# Function to build the linear operator that maps monthly values to daily values
+def interpolation_operator(season_months, year=2024):
+    """
+    Builds the (days x months) weight matrix of the monthly-to-daily interpolation.
+
+    Because the interpolation is linear in the monthly values, daily values for any
+    number of series are obtained with one matrix product:
+
+        daily = interpolation_operator(season_months) @ monthly  # (days x series)
+
+    Each row holds at most two non-zero weights (the current and next month). The
+    matrix is kept dense so the product is a single BLAS call; it is cached per
+    season and year and is read-only. Results agree with
+    interpolate_monthly_to_daily_batch to within floating-point rounding.
+
+    Parameters:
+    - season_months: List of integers representing months in the growing season
+    - year: Year in which the season starts, used for the month lengths
+
+    Returns:
+    - operator: Array of shape (days in season, len(season_months))
+    """
+    return _interpolation_operator(tuple(season_months), year)
+
+# Function to build the interpolation operator of a season, cached per season and year
+@functools.lru_cache(maxsize=None)
+def _interpolation_operator(season_months, year):
+    segment, offset, segment_days = season_calendar(season_months, year)
+    months = len(season_months)
+
+    # Weight of the next month's value grows linearly through each month interval
+    next_weight = offset / segment_days[segment]
+    start_column = segment
+    end_column = (segment + 1) % months  # The last month runs towards the first month
+
+    operator = np.zeros((len(segment), months))
+    days = np.arange(len(segment))
+    np.add.at(operator, (days, start_column), 1 - next_weight)
+    np.add.at(operator, (days, end_column), next_weight)
+    operator.setflags(write=False)
+    return operator
+
+# Function to interpolate monthly data to daily values using linear interpolation
+def interpolate_monthly_to_daily(monthly_data, season_months):
+    """
+    Interpolates monthly data to daily values for the growing season using linear interpolation.
+    
+    Parameters:
+    - monthly_data: List of monthly data (e.g., ETr or rainfall)
+    - season_months: List of integers representing months in the growing season
+    
+    Returns:
+    - daily_data: List of interpolated daily data values for the entire growing season
+    """
+    return list(interpolate_monthly_to_daily_batch(monthly_data, season_months))
+
+# Keys of the daily irrigation schedule records
+SCHEDULE_RECORD_KEYS = [
+    'day', 'growing_season', 'growth_stage', 'crop_type', 'kc', 'ETo (mm/day)',
+    'Crop water use (Etc) (mm/day)', 'Rainfall (mm)', 'Net Irrigation application (mm)',
+    'Cumulative soil water deficit (mm)', 'Irrigation Required',
+]
+
+# Keys of the records of schedules built from dated daily data, with the date after the day
+DATED_SCHEDULE_RECORD_KEYS = SCHEDULE_RECORD_KEYS[:1] + ['date'] + SCHEDULE_RECORD_KEYS[1:]
+
+# Columnar result of daily_irrigation_schedule
+class ScheduleResult:
+    """
+    Daily irrigation schedule stored as one NumPy array per column.
+
+    Columns that are constant over the season (growing season, crop type) are
+    stored once, and the growth stage is stored as an index into growth_stages.
+    Iterating over the result (or indexing it with a day number starting at 0)
+    gives the same daily records as a list of dictionaries with the keys in
+    SCHEDULE_RECORD_KEYS (DATED_SCHEDULE_RECORD_KEYS, with the date of each day,
+    for schedules built from dated daily data), and to_pandas/to_arrow convert
+    the arrays without copying the numeric columns.
+
+    Attributes:
+    - growing_season: Growing season of the schedule (e.g., Kharif)
+    - crop_type: Crop type of the schedule (e.g., cotton)
+    - growth_stages: Names of the crop growth stages
+    - day: Day of the season, starting at 1
+    - stage_index: Index of the growth stage of each day in growth_stages
+    - kc: Crop coefficient
+    - etr: Reference evapotranspiration (ETr) (mm/day)
+    - etc: Crop evapotranspiration (ETc) (mm/day)
+    - rainfall: Daily rainfall (mm)
+    - net_irrigation: Net irrigation application (mm)
+    - soil_water_deficit: Cumulative soil water deficit (mm)
+    - irrigation_required: Whether irrigation is required on each day
+    - date: Calendar date (datetime64[D]) of each day, or None for schedules built
+      from interpolated monthly data
+    """
+
+    # Number of rows converted to Python values at a time while iterating
+    ITER_BLOCK_ROWS = 4096
+
+    def __init__(self, days, crop_type, growth_stages, growing_season='Kharif'):
+        self.growing_season = growing_season
+        self.crop_type = crop_type
+        self.growth_stages = tuple(growth_stages)
+        self.day = np.arange(1, days + 1, dtype=np.int64)
+        self.stage_index = np.zeros(days, dtype=np.int8)
+        self.kc = np.zeros(days)
+        self.etr = np.zeros(days)
+        self.etc = np.zeros(days)
+        self.rainfall = np.zeros(days)
+        self.net_irrigation = np.zeros(days)
+        self.soil_water_deficit = np.zeros(days)
+        self.irrigation_required = np.zeros(days, dtype=bool)
+        self.date = None
+
+    def __len__(self):
+        return len(self.day)
+
+    def _record(self, day, stage_index, kc, etr, etc, rainfall, net_irrigation, soil_water_deficit, irrigation_required,
+                date=None):
+        if self.date is None:
+            return dict(zip(SCHEDULE_RECORD_KEYS, (
+                day, self.growing_season, self.growth_stages[stage_index], self.crop_type, kc, etr, etc, rainfall,
+                net_irrigation, soil_water_deficit, 'Yes' if irrigation_required else 'No',
+            )))
+        return dict(zip(DATED_SCHEDULE_RECORD_KEYS, (
+            day, date, self.growing_season, self.growth_stages[stage_index], self.crop_type, kc, etr, etc, rainfall,
+            net_irrigation, soil_water_deficit, 'Yes' if irrigation_required else 'No',
+        )))
+
+    def _columns(self):
+        columns = (
+            self.day, self.stage_index, self.kc, self.etr, self.etc, self.rainfall,
+            self.net_irrigation, self.soil_water_deficit, self.irrigation_required,
+        )
+        # The date (as datetime.date) comes last, matching the date argument of _record
+        return columns if self.date is None else columns + (self.date,)
+
+    def __iter__(self):
+        # Convert the columns to Python values a block of rows at a time, so that
+        # streaming the records does not hold the whole schedule as Python objects
+        columns = self._columns()
+        for start in range(0, len(self), self.ITER_BLOCK_ROWS):
+            block = slice(start, start + self.ITER_BLOCK_ROWS)
+            for values in zip(*(column[block].tolist() for column in columns)):
+                yield self._record(*values)
+
+    def __getitem__(self, index):
+        return self._record(*(column[index].item() for column in self._columns()))
+
+    def to_pandas(self):
+        """
+        Converts the schedule to a pandas DataFrame with the record keys as columns
+        (and 'date', for schedules built from dated daily data).
+
+        The text columns become categorical columns sharing one small set of categories.
+        """
+        import pandas as pd  # Loaded lazily, only when a DataFrame is requested
+
+        constant_codes = np.zeros(len(self), dtype=np.int8)
+        dates = {} if self.date is None else {'date': self.date}
+        return pd.DataFrame({
+            'day': self.day,
+            **dates,
+            'growing_season': pd.Categorical.from_codes(constant_codes, [self.growing_season]),
+            'growth_stage': pd.Categorical.from_codes(self.stage_index, self.growth_stages),
+            'crop_type': pd.Categorical.from_codes(constant_codes, [self.crop_type]),
+            'kc': self.kc,
+            'ETo (mm/day)': self.etr,
+            'Crop water use (Etc) (mm/day)': self.etc,
+            'Rainfall (mm)': self.rainfall,
+            'Net Irrigation application (mm)': self.net_irrigation,
+            'Cumulative soil water deficit (mm)': self.soil_water_deficit,
+            'Irrigation Required': pd.Categorical.from_codes(self.irrigation_required.view(np.int8), ['No', 'Yes']),
+        }, copy=False)
+
+    def to_arrow(self):
+        """
+        Converts the schedule to a pyarrow Table with the record keys as columns
+        (and 'date', for schedules built from dated daily data).
+
+        The text columns become dictionary-encoded columns.
+        """
+        import pyarrow as pa  # Loaded lazily, only when an Arrow table is requested
+
+        constant_codes = pa.array(np.zeros(len(self), dtype=np.int8))
+        dates = {} if self.date is None else {'date': self.date}
+        return pa.table({
+            'day': self.day,
+            **dates,
+            'growing_season': pa.DictionaryArray.from_arrays(constant_codes, [self.growing_season]),
+            'growth_stage': pa.DictionaryArray.from_arrays(self.stage_index, list(self.growth_stages)),
+            'crop_type': pa.DictionaryArray.from_arrays(constant_codes, [self.crop_type]),
+            'kc': self.kc,
+            'ETo (mm/day)': self.etr,
+            'Crop water use (Etc) (mm/day)': self.etc,
+            'Rainfall (mm)': self.rainfall,
+            'Net Irrigation application (mm)': self.net_irrigation,
+            'Cumulative soil water deficit (mm)': self.soil_water_deficit,
+            'Irrigation Required': pa.DictionaryArray.from_arrays(self.irrigation_required.view(np.int8), ['No', 'Yes']),
+        })
+
+# Main function to generate daily irrigation schedule for the growing season
+def daily_irrigation_schedule(soil, crop, climate, season_months, rainfall_data, growing_season='Kharif', kc_curve='stages',
+                              skip_to_events=False):
+    """
+    Generates a daily irrigation schedule for the crop based on soil, crop, and climate data.
+    
+    Parameters:
+    - soil: Dictionary containing soil properties (e.g., field capacity, wilting point)
+    - crop: Dictionary containing crop properties (e.g., growth stages, crop coefficient)
+    - climate: Dictionary containing monthly ETr and rainfall data
+    - season_months: List of months in the growing season
+    - rainfall_data: List of interpolated daily rainfall data
+    - growing_season: Name of the growing season (e.g., Kharif or Rabi)
+    - kc_curve: Shape of the daily Kc curve, 'stages' or 'fao56' (see crop_kc_curve)
+    - skip_to_events: Whether to jump between irrigations (see accumulate_soil_water_deficit)
+    
+    Returns:
+    - schedule: ScheduleResult holding the daily irrigation schedule records as arrays
+    """
+    # Interpolate ETr and rainfall data from monthly to daily values in one pass
+    daily_etr, daily_rainfall = interpolate_monthly_to_daily_batch(
+        np.column_stack([climate['ETr'], rainfall_data]), season_months
+    ).T
+    return schedule_daily_series(soil, crop, daily_etr, daily_rainfall, growing_season, kc_curve, skip_to_events)
+
+# Function to generate a daily irrigation schedule from daily ETr and rainfall
+def schedule_daily_series(soil, crop, daily_etr, daily_rainfall, growing_season='Kharif', kc_curve='stages', skip_to_events=False):
+    """
+    Generates a daily irrigation schedule from daily climate data, without interpolation.
+
+    Parameters:
+    - soil: Dictionary containing soil properties (e.g., field capacity, wilting point)
+    - crop: Dictionary containing crop properties (e.g., growth stages, crop coefficient)
+    - daily_etr: Array of daily ETr (mm/day) starting on the first day of the season
+    - daily_rainfall: Array of daily rainfall (mm) starting on the first day of the season
+    - growing_season: Name of the growing season (e.g., Kharif or Rabi)
+    - kc_curve: Shape of the daily Kc curve, 'stages' or 'fao56' (see crop_kc_curve)
+    - skip_to_events: Whether to jump between irrigations (see accumulate_soil_water_deficit)
+
+    Returns:
+    - schedule: ScheduleResult holding the daily irrigation schedule records as arrays
+    """
+    season_length = sum(int(properties['days']) for properties in crop['growth_stages'].values())
+    if season_length > len(daily_etr):
+        raise IndexError(f"Growth stages last {season_length} days but climate data covers only {len(daily_etr)} days")
+
+    schedule, _ = schedule_days(
+        soil, crop, daily_etr[:season_length], daily_rainfall[:season_length],
+        growing_season=growing_season, kc_curve=kc_curve, skip_to_events=skip_to_events,
+    )
+    return schedule  # Return the generated irrigation schedule
+
+# Function to step the soil water deficit through a run of days, one day at a time
+def _step_soil_water_deficit(soil_water_balance, max_allowable_depletion, soil_water_deficit, out, irrigation_required, start, stop):
+    cumulative_soil_water_deficit = soil_water_deficit
+    for day, balance in enumerate(soil_water_balance[start:stop].tolist(), start):
+        # Update the cumulative soil water deficit
+        cumulative_soil_water_deficit += balance
+
+        # Check if irrigation is needed
+        if cumulative_soil_water_deficit > max_allowable_depletion:
+            irrigation_required[day] = True
+            cumulative_soil_water_deficit = 0  # Reset soil water deficit after irrigation
+        out[day] = cumulative_soil_water_deficit
+    return cumulative_soil_water_deficit
+
+# Function to accumulate the daily soil water deficit with irrigation resets
+def accumulate_soil_water_deficit(soil_water_balance, max_allowable_depletion, soil_water_deficit=0.0,
+                                  out=None, irrigation_required=None, skip_to_events=False, window=64):
+    """
+    Accumulates the daily net water balance into the cumulative soil water deficit,
+    resetting it to 0 on the days it exceeds the max allowable depletion (irrigation).
+
+    By default the days are processed one at a time. With skip_to_events, the
+    running sum of the balance is taken over a window of days at once, the first
+    day above the max allowable depletion is found with one vectorized search and
+    the days up to it are filled in bulk; the search restarts after the irrigation
+    and the window doubles while no irrigation is found. This is much faster for
+    long runs with few irrigations (e.g., dry-season deficits that stay negative).
+    When an irrigation follows the previous one within half a window, the days are
+    stepped one at a time instead until a whole window passes without irrigation,
+    so frequent irrigation (e.g., monsoon rain keeping the deficit positive) costs
+    about the same as the loop.
+    The running sum adds the days in order, so both modes give identical deficits.
+
+    Parameters:
+    - soil_water_balance: Array of the daily net water balance (effective rainfall - ETc) (mm)
+    - max_allowable_depletion: Deficit (mm) above which the field is irrigated
+    - soil_water_deficit: Cumulative soil water deficit (mm) before the first day
+    - out: Array receiving the unrounded cumulative soil water deficit of each day (default: new array)
+    - irrigation_required: Boolean array set to True on the days irrigation is required (default: new array)
+    - skip_to_events: Whether to jump from one irrigation to the next instead of stepping every day
+    - window: Number of days summed at once after each irrigation when skipping to events
+
+    Returns:
+    - Unrounded cumulative soil water deficit (mm) at the end of the last day
+      (out and irrigation_required hold the daily values)
+    """
+    soil_water_balance = np.asarray(soil_water_balance, dtype=float)
+    days = len(soil_water_balance)
+    if out is None:
+        out = np.empty(days)
+    if irrigation_required is None:
+        irrigation_required = np.zeros(days, dtype=bool)
+
+    if not skip_to_events:
+        return _step_soil_water_deficit(soil_water_balance, max_allowable_depletion, soil_water_deficit,
+                                        out, irrigation_required, 0, days)
+
+    start, size = 0, window
+    while start < days:
+        stop = min(start + size, days)
+
+        # Running sum of the window, continuing from the deficit of the previous day
+        cumulative = out[start:stop]
+        cumulative[:] = soil_water_balance[start:stop]
+        cumulative[0] = soil_water_deficit + cumulative[0]
+        np.cumsum(cumulative, out=cumulative)
+
+        # First day of the window on which irrigation is needed, if any
+        exceeded = cumulative > max_allowable_depletion
+        day = int(exceeded.argmax())
+        if not exceeded[day]:
+            soil_water_deficit = cumulative[-1]
+            start, size = stop, 2 * size
+            continue
+
+        irrigation_required[start + day] = True
+        cumulative[day] = 0  # Reset soil water deficit after irrigation
+        soil_water_deficit = 0
+        start, size = start + day + 1, max(window, 2 * (day + 1))
+
+        # Irrigation is frequent here: step one day at a time, a window at a time,
+        # until a whole window passes without irrigation
+        stepping = day < window // 2
+        while stepping and start < days:
+            stop = min(start + window, days)
+            soil_water_deficit = _step_soil_water_deficit(soil_water_balance, max_allowable_depletion, soil_water_deficit,
+                                                          out, irrigation_required, start, stop)
+            stepping = irrigation_required[start:stop].any()
+            start = stop
+    return soil_water_deficit
+
+# Function to advance the daily water balance over part of the season
+def schedule_days(soil, crop, daily_etr, daily_rainfall, start_day=0, soil_water_deficit=0.0, growing_season='Kharif',
+                  kc_curve='stages', skip_to_events=False):
+    """
+    Generates the irrigation schedule of consecutive days of the season, starting from a known soil water deficit.
+
+    Running the season in parts (e.g., one day at a time, passing on the returned
+    deficit) gives the same schedule as running it at once, and the cost only
+    depends on the number of days given.
+
+    Parameters:
+    - soil: Dictionary containing soil properties (e.g., field capacity, wilting point)
+    - crop: Dictionary containing crop properties (e.g., growth stages, crop coefficient)
+    - daily_etr: Array of daily ETr (mm/day) of the days to schedule
+    - daily_rainfall: Array of daily rainfall (mm) of the days to schedule
+    - start_day: Number of days of the season already scheduled
+    - soil_water_deficit: Unrounded cumulative soil water deficit (mm) at the end of the last scheduled day
+    - growing_season: Name of the growing season (e.g., Kharif or Rabi)
+    - kc_curve: Shape of the daily Kc curve, 'stages' or 'fao56' (see crop_kc_curve)
+    - skip_to_events: Whether to jump between irrigations (see accumulate_soil_water_deficit)
+
+    Returns:
+    - schedule: ScheduleResult of the days, numbered from start_day + 1
+    - soil_water_deficit: Unrounded cumulative soil water deficit (mm) at the end of the last day
+
+    Raises:
+    - IndexError: If the days run past the end of the growth stages
+    """
+    # Find the growth stage (e.g., initial, development, mid-season, late-season) of each day
+    stage_days = [int(properties['days']) for properties in crop['growth_stages'].values()]
+    stage_end = np.cumsum(stage_days)
+    days = len(daily_etr)
+    if start_day + days > stage_end[-1]:
+        raise IndexError(f"Growth stages last {stage_end[-1]} days but days {start_day + 1}-{start_day + days} were given")
+
+    # Preallocate the schedule for the days
+    schedule = ScheduleResult(days, crop['crop_type'], crop['growth_stages'], growing_season)
+    schedule.day += start_day
+    schedule.stage_index[:] = np.searchsorted(stage_end, np.arange(start_day, start_day + days), side='right')
+    schedule.kc[:] = daily_kc_curve(crop, kc_curve)[start_day:start_day + days]
+    schedule.etr[:] = daily_etr
+    schedule.rainfall[:] = daily_rainfall
+
+    # Calculate crop water use (ETc)
+    schedule.etc[:] = calculate_et(schedule.kc, schedule.etr)
+
+    # Calculate effective rainfall (assuming no losses)
+    effective_rainfall = np.maximum(schedule.rainfall - 0, 0)  # No losses in this example
+
+    # Determine net irrigation requirement
+    max_allowable_depletion = 0.7 * (soil['field_capacity'] - soil['wilting_point']) * crop['root_depth'] * 10  # Max allowable soil depletion
+
+    # Accumulate the soil water deficit, irrigating when it exceeds the max allowable depletion
+    cumulative_soil_water_deficit = accumulate_soil_water_deficit(
+        effective_rainfall - schedule.etc, max_allowable_depletion, soil_water_deficit,
+        out=schedule.soil_water_deficit, irrigation_required=schedule.irrigation_required,
+        skip_to_events=skip_to_events,
+    )
+
+    # Apply maximum allowable irrigation on the days irrigation is required
+    schedule.net_irrigation[schedule.irrigation_required] = round(max_allowable_depletion, 2)
+    schedule.soil_water_deficit[:] = np.round(schedule.soil_water_deficit, 2)
+    return schedule, cumulative_soil_water_deficit
+
+# Function to generate a daily irrigation schedule from dated daily ETr and rainfall
+def schedule_by_date(soil, crop, dates, daily_etr, daily_rainfall, sowing_date, growing_season='Kharif', kc_curve='stages',
+                     skip_to_events=False):
+    """
+    Generates a daily irrigation schedule from dated daily climate data, starting on the sowing date.
+
+    Daily ETr (e.g., computed per day with reference_et_batch) is used as it is,
+    without interpolating monthly values.
+
+    Parameters:
+    - soil: Dictionary containing soil properties (e.g., field capacity, wilting point)
+    - crop: Dictionary containing crop properties (e.g., growth stages, crop coefficient)
+    - dates: Array of dates of the daily climate data, in increasing order
+    - daily_etr: Array of daily ETr (mm/day), one value per date
+    - daily_rainfall: Array of daily rainfall (mm), one value per date
+    - sowing_date: Date of the first day of the season (e.g., '2024-04-15')
+    - growing_season: Name of the growing season (e.g., Kharif or Rabi)
+    - kc_curve: Shape of the daily Kc curve, 'stages' or 'fao56' (see crop_kc_curve)
+    - skip_to_events: Whether to jump between irrigations (see accumulate_soil_water_deficit)
+
+    Returns:
+    - schedule: ScheduleResult with the date of each day of the season
+
+    Raises:
+    - KeyError: If the sowing date is not in the climate data
+    - ValueError: If the climate data misses a day of the season
+    """
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    sowing_date = np.datetime64(sowing_date, 'D')
+    start = int(np.searchsorted(dates, sowing_date))
+    if start == len(dates) or dates[start] != sowing_date:
+        raise KeyError(str(sowing_date))
+
+    season_length = sum(int(properties['days']) for properties in crop['growth_stages'].values())
+    season_dates = dates[start:start + season_length]
+    if len(season_dates) < season_length or (np.diff(season_dates) != np.timedelta64(1, 'D')).any():
+        raise ValueError(f"Daily climate data must cover every day from {sowing_date} for {season_length} days")
+
+    season = slice(start, start + season_length)
+    schedule = schedule_daily_series(
+        soil, crop, np.asarray(daily_etr)[season], np.asarray(daily_rainfall)[season], growing_season, kc_curve,
+        skip_to_events,
+    )
+    schedule.date = season_dates
+    return schedule
@@ -0,0 +1,92 @@
+"""
+Streaming ETr calculation for large station files.
+
+stream_station_etr reads a CSV export of station records in chunks, computes
+ETr for each chunk with the Modified Penman Method and appends the results to
+the output file, so peak memory is set by the chunk size and not by the size
+of the file. ETr is rounded to 2 decimal places like the Excel output.
+"""
+# Import necessary libraries
+from irrigation.et import PENMAN_COLUMNS, modified_penman_batch, round_et
+from irrigation.writers import output_format_of
+
+
+# Incremental writer of CSV output
+class _CsvAppender:
+    def __init__(self, output_file):
+        self.output_file = output_file
+        self.header = True
+
+    def append(self, table):
+        table.to_csv(self.output_file, mode='w' if self.header else 'a', header=self.header, index=False)
+        self.header = False
+
+    def close(self):
+        pass
+
+# Incremental writer of Parquet or Arrow IPC output
+class _ArrowAppender:
+    def __init__(self, output_file, output_format):
+        self.output_file = output_file
+        self.output_format = output_format
+        self.writer = None
+        self.schema = None
+
+    def append(self, table):
+        import pyarrow as pa  # Loaded lazily, only when columnar output is requested
+
+        table = pa.Table.from_pandas(table, preserve_index=False)
+        if self.writer is None:
+            # The first chunk fixes the schema; later chunks are cast to it
+            self.schema = table.schema
+            if self.output_format == 'parquet':
+                import pyarrow.parquet as pq  # Loaded lazily, only when Parquet output is requested
+
+                self.writer = pq.ParquetWriter(self.output_file, self.schema)
+            else:
+                self.writer = pa.ipc.new_file(self.output_file, self.schema)
+        self.writer.write_table(table.cast(self.schema))
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+# Function to calculate ETr for a station file chunk by chunk
+def stream_station_etr(input_file, output_file, chunk_rows=100_000, output_format=None):
+    """
+    Calculates ETr with the Modified Penman Method for a CSV file of station records, chunk by chunk.
+
+    Every column of the input other than those in PENMAN_COLUMNS (e.g., station id
+    and date) is copied to the output, followed by the 'ETr' column (mm/day),
+    rounded to 2 decimal places (see round_et).
+
+    Parameters:
+    - input_file: Path of the CSV file with the columns listed in PENMAN_COLUMNS
+    - output_file: Path of the output file (CSV, Parquet or Arrow IPC)
+    - chunk_rows: Number of records read and processed at a time
+    - output_format: Output format (default: from the file extension)
+
+    Returns:
+    - rows: Number of records processed
+    """
+    import pandas as pd  # Loaded lazily, only when a station file is read
+
+    output_format = output_format_of(output_file, output_format)
+    if output_format == 'csv':
+        appender = _CsvAppender(output_file)
+    elif output_format in ('parquet', 'arrow'):
+        appender = _ArrowAppender(output_file, output_format)
+    else:
+        raise ValueError(f"Streaming output must be csv, parquet or arrow, not {output_format!r}")
+
+    rows = 0
+    try:
+        with pd.read_csv(input_file, chunksize=chunk_rows, dtype={column: float for column in PENMAN_COLUMNS}) as reader:
+            for chunk in reader:
+                result = chunk.drop(columns=PENMAN_COLUMNS)
+                result['ETr'] = round_et(modified_penman_batch(chunk))
+                appender.append(result)
+                rows += len(chunk)
+    finally:
+        appender.close()
+    return rows
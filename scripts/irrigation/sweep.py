@@ -0,0 +1,146 @@
+"""
+Scenario sweeps of irrigation schedules over a process pool.
+
+scenario_sweep schedules every combination of climate station, growing
+season, soil type and crop type. The daily climate of all stations and
+seasons is interpolated once in the parent process and placed in shared memory
+(see irrigation.parallel); workers attach to it through the pool initializer,
+and tasks only carry integer indices and are sent in chunks. Worker results
+come back as NumPy columns and are joined into one columnar pandas DataFrame.
+"""
+# Import necessary libraries
+import concurrent.futures  # For the process pool
+import itertools  # For the cross product of scenarios
+import math  # For the chunk size
+import os  # For the number of processors
+
+import numpy as np  # For the climate arrays and result columns
+
+from irrigation.parallel import SharedArrays, attach_shared_arrays
+from irrigation.scheduling import GROWTH_STAGE_COLUMNS, interpolate_monthly_to_daily_batch, schedule_daily_series
+
+# Months of the growing seasons
+SEASONS = {
+    'Kharif': (4, 5, 6, 7, 8, 9),
+    'Rabi': (10, 11, 12, 1, 2, 3),
+}
+
+# Numeric columns of the sweep results and the ScheduleResult attribute holding each
+_SCHEDULE_COLUMNS = {
+    'day': 'day',
+    'kc': 'kc',
+    'ETo (mm/day)': 'etr',
+    'Crop water use (Etc) (mm/day)': 'etc',
+    'Rainfall (mm)': 'rainfall',
+    'Net Irrigation application (mm)': 'net_irrigation',
+    'Cumulative soil water deficit (mm)': 'soil_water_deficit',
+}
+
+# Read-only inputs of the sweep held by each worker process
+_worker_inputs = {}
+
+
+# Function to interpolate the monthly climate of every station for every season
+def seasonal_daily_climate(climate, seasons):
+    """
+    Interpolates the monthly ETr and rainfall of all stations to daily values per season.
+
+    Parameters:
+    - climate: Dictionary mapping each station to a dictionary with 'ETr' and 'Rainfall',
+      each a list of 12 monthly values from January to December
+    - seasons: List of growing season names in SEASONS
+
+    Returns:
+    - Dictionary mapping each season to an array (2 x days x stations) of daily ETr and rainfall
+    """
+    stations = list(climate)
+    daily_climate = {}
+    for season in seasons:
+        month_index = [month - 1 for month in SEASONS[season]]
+        monthly = np.stack([
+            np.asarray([climate[station][variable] for station in stations], dtype=float)[:, month_index].T
+            for variable in ('ETr', 'Rainfall')
+        ])
+        # Interpolate both variables of all stations in one call: (months x 2 * stations)
+        daily = interpolate_monthly_to_daily_batch(monthly.transpose(1, 0, 2).reshape(len(month_index), -1), SEASONS[season])
+        daily_climate[season] = daily.reshape(len(daily), 2, len(stations)).transpose(1, 0, 2).copy()
+    return daily_climate
+
+# Function to store the sweep inputs in a worker process
+def _init_worker(soils, crops, seasons, daily_climate):
+    if isinstance(daily_climate, tuple):
+        # Descriptor of the climate arrays in shared memory
+        daily_climate = attach_shared_arrays(daily_climate)
+    _worker_inputs.update(soils=soils, crops=crops, seasons=seasons, daily_climate=daily_climate)
+
+# Function to schedule a chunk of scenarios in a worker process
+def _run_chunk(tasks):
+    soils = _worker_inputs['soils']
+    crops = _worker_inputs['crops']
+    seasons = _worker_inputs['seasons']
+    daily_climate = _worker_inputs['daily_climate']
+
+    keys = {name: [] for name in ('station', 'season', 'soil', 'crop')}
+    columns = {name: [] for name in list(_SCHEDULE_COLUMNS) + ['growth_stage', 'Irrigation Required']}
+    for station, season, soil, crop in tasks:
+        daily_etr, daily_rainfall = daily_climate[seasons[season]][:, :, station]
+        schedule = schedule_daily_series(soils[soil], crops[crop], daily_etr, daily_rainfall, seasons[season])
+        for name, value in zip(keys, (station, season, soil, crop)):
+            keys[name].append(np.full(len(schedule), value, dtype=np.int32))
+        for name, attribute in _SCHEDULE_COLUMNS.items():
+            columns[name].append(getattr(schedule, attribute))
+        columns['growth_stage'].append(schedule.stage_index)
+        columns['Irrigation Required'].append(schedule.irrigation_required.view(np.int8))
+    return {name: np.concatenate(values) for name, values in itertools.chain(keys.items(), columns.items())}
+
+# Function to schedule every combination of station, season, soil and crop
+def scenario_sweep(soils, crops, climate, seasons=('Kharif', 'Rabi'), max_workers=None, chunksize=None):
+    """
+    Generates daily irrigation schedules for every combination of station, season, soil and crop.
+
+    Parameters:
+    - soils: List of soil dictionaries (rows of the Soil sheet)
+    - crops: List of crop dictionaries (rows of the Crops sheet) with 'growth_stages'
+    - climate: Dictionary mapping each station to a dictionary with 'ETr' and 'Rainfall',
+      each a list of 12 monthly values from January to December
+    - seasons: Growing season names in SEASONS
+    - max_workers: Number of worker processes (default: number of processors; 1 runs
+      the sweep in this process)
+    - chunksize: Number of scenarios per task (default: about four tasks per worker)
+
+    Returns:
+    - DataFrame with the daily schedule of every scenario, keyed by the categorical
+      'station', 'growing_season', 'soil_type' and 'crop_type' columns
+    """
+    import pandas as pd  # Loaded lazily, only when the results are collected
+
+    seasons = list(seasons)
+    stations = list(climate)
+    daily_climate = seasonal_daily_climate(climate, seasons)
+    tasks = list(itertools.product(range(len(stations)), range(len(seasons)), range(len(soils)), range(len(crops))))
+
+    max_workers = max_workers or os.cpu_count() or 1
+    chunksize = chunksize or max(1, math.ceil(len(tasks) / (4 * max_workers)))
+    chunks = [tasks[start:start + chunksize] for start in range(0, len(tasks), chunksize)]
+
+    if max_workers == 1:
+        _init_worker(soils, crops, seasons, daily_climate)
+        results = [_run_chunk(chunk) for chunk in chunks]
+    else:
+        with SharedArrays(daily_climate) as shared:
+            initargs = (soils, crops, seasons, shared.descriptor)
+            with concurrent.futures.ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=initargs) as executor:
+                results = list(executor.map(_run_chunk, chunks))
+
+    # Join the columns of all chunks
+    columns = {name: np.concatenate([result[name] for result in results]) for name in results[0]}
+    return pd.DataFrame({
+        'station': pd.Categorical.from_codes(columns['station'], stations),
+        'growing_season': pd.Categorical.from_codes(columns['season'], seasons),
+        'soil_type': pd.Categorical.from_codes(columns['soil'], [soil['soil_type'] for soil in soils]),
+        'crop_type': pd.Categorical.from_codes(columns['crop'], [crop['crop_type'] for crop in crops]),
+        'day': columns['day'],
+        'growth_stage': pd.Categorical.from_codes(columns['growth_stage'], list(GROWTH_STAGE_COLUMNS)),
+        **{name: columns[name] for name in list(_SCHEDULE_COLUMNS)[1:]},
+        'Irrigation Required': pd.Categorical.from_codes(columns['Irrigation Required'], ['No', 'Yes']),
+    }, copy=False)
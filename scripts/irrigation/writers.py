@@ -0,0 +1,153 @@
+"""
+Pluggable output writers for irrigation schedules and ETr results.
+
+Tables can be written as Excel (xlsx), Parquet, CSV or Arrow IPC (arrow). The
+format is chosen explicitly or from the file extension, and further formats can
+be added with register_writer. In the columnar formats the repeated text
+columns of a schedule are stored as categorical (dictionary-encoded) columns.
+pandas and pyarrow are imported only when a table is written.
+"""
+# Import necessary libraries
+import os  # For finding the output format from the file extension
+
+from irrigation import excel  # Excel output with formatted headers
+
+# Columns of a schedule that repeat a few values and are stored as categories
+SCHEDULE_CATEGORICAL_COLUMNS = ['growing_season', 'growth_stage', 'crop_type', 'Irrigation Required']
+
+# File extensions of the supported output formats
+FORMAT_EXTENSIONS = {
+    '.xlsx': 'xlsx',
+    '.parquet': 'parquet',
+    '.csv': 'csv',
+    '.arrow': 'arrow',
+    '.ipc': 'arrow',
+    '.feather': 'arrow',
+}
+
+
+# Function to write a DataFrame to a Parquet file
+def _write_parquet(table, output_file):
+    table.to_parquet(output_file, index=False)
+
+# Function to write a DataFrame to a CSV file
+def _write_csv(table, output_file):
+    table.to_csv(output_file, index=False)
+
+# Function to write a DataFrame to an Arrow IPC file
+def _write_arrow(table, output_file):
+    import pyarrow as pa  # Loaded lazily, only when Arrow output is requested
+
+    arrow_table = pa.Table.from_pandas(table, preserve_index=False)
+    with pa.OSFile(output_file, 'wb') as sink:
+        with pa.ipc.new_file(sink, arrow_table.schema) as writer:
+            writer.write_table(arrow_table)
+
+# Function to write a DataFrame to an Excel workbook
+def _write_xlsx(table, output_file):
+    table.to_excel(output_file, index=False)
+
+# Writers of DataFrames for each output format
+WRITERS = {
+    'xlsx': _write_xlsx,
+    'parquet': _write_parquet,
+    'csv': _write_csv,
+    'arrow': _write_arrow,
+}
+
+# Function to add or replace the writer of an output format
+def register_writer(output_format, writer, extensions=()):
+    """
+    Registers a writer for an output format.
+
+    Parameters:
+    - output_format: Name of the format (e.g., 'parquet')
+    - writer: Function taking a DataFrame and an output file path
+    - extensions: File extensions (e.g., '.parquet') that select this format
+    """
+    WRITERS[output_format] = writer
+    for extension in extensions:
+        FORMAT_EXTENSIONS[extension.lower()] = output_format
+
+# Function to find the output format of a file
+def output_format_of(output_file, output_format=None):
+    """
+    Returns the output format to use for a file.
+
+    Parameters:
+    - output_file: Path of the output file
+    - output_format: Format requested explicitly, if any
+
+    Returns:
+    - Name of the output format
+
+    Raises:
+    - ValueError: If the format is unknown or cannot be found from the file extension
+    """
+    if output_format is None:
+        extension = os.path.splitext(output_file)[1].lower()
+        if extension not in FORMAT_EXTENSIONS:
+            raise ValueError(f"Cannot tell the output format of {output_file!r}; use one of {sorted(WRITERS)}")
+        output_format = FORMAT_EXTENSIONS[extension]
+    if output_format not in WRITERS:
+        raise ValueError(f"Unknown output format {output_format!r}; use one of {sorted(WRITERS)}")
+    return output_format
+
+# Function to convert schedule records to a DataFrame with categorical text columns
+def schedule_table(schedule):
+    """
+    Converts an irrigation schedule to a pandas DataFrame.
+
+    Parameters:
+    - schedule: ScheduleResult from daily_irrigation_schedule, or a list of daily
+      irrigation schedule records
+
+    Returns:
+    - DataFrame with one row per day, with SCHEDULE_CATEGORICAL_COLUMNS as categories
+    """
+    if hasattr(schedule, 'to_pandas'):
+        return schedule.to_pandas()
+
+    import pandas as pd  # Loaded lazily, only when output is requested
+
+    table = pd.DataFrame(schedule)
+    for column in SCHEDULE_CATEGORICAL_COLUMNS:
+        if column in table:
+            table[column] = table[column].astype('category')
+    return table
+
+# Function to save an irrigation schedule in any output format
+def write_schedule_output(schedule, output_file, output_format=None):
+    """
+    Saves a daily irrigation schedule as Excel, Parquet, CSV or Arrow IPC.
+
+    Excel output uses the formatted, streaming writer of irrigation.excel; the other
+    formats store the schedule records unrounded with categorical text columns.
+
+    Parameters:
+    - schedule: ScheduleResult from daily_irrigation_schedule, or a list of daily
+      irrigation schedule records
+    - output_file: Path of the output file
+    - output_format: Output format (default: from the file extension)
+    """
+    output_format = output_format_of(output_file, output_format)
+    if output_format == 'xlsx':
+        excel.write_schedule(schedule, output_file)
+    else:
+        WRITERS[output_format](schedule_table(schedule), output_file)
+
+# Function to save ETr results in any output format
+def write_etr_output(months, etr, output_file, output_format=None):
+    """
+    Saves ETr results as Excel, Parquet, CSV or Arrow IPC.
+
+    Parameters:
+    - months: Sequence of month (or date) labels
+    - etr: Sequence of ETr values (mm/day)
+    - output_file: Path of the output file
+    - output_format: Output format (default: from the file extension)
+    """
+    import pandas as pd  # Loaded lazily, only when output is requested
+
+    output_format = output_format_of(output_file, output_format)
+    WRITERS[output_format](pd.DataFrame({'Month': months, 'ETr': etr}), output_file)
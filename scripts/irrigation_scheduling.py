@@ -1,208 +1,143 @@
 # Import necessary libraries
-import pandas as pd  # For data manipulation and reading from Excel
-from openpyxl import Workbook  # For writing data to Excel with formatting
-from openpyxl.styles import Font  # For styling Excel headers
-import datetime  # For date handling in interpolation
-import numpy as np  # For numerical operations, especially generating daily values from monthly data
-
-# Function to calculate crop evapotranspiration (ET) based on crop coefficient (kc) and reference ET (ETr)
-def calculate_et(crop_kc, etr):
-    """
-    Calculates the crop evapotranspiration (ETc) using the formula: ETc = ETr * kc
-    
-    Parameters:
-    - crop_kc: Crop coefficient for the current growth stage
-    - etr: Reference evapotranspiration (ETr) in mm/day
-    
-    Returns:
-    - ETc: Crop evapotranspiration (ETc) in mm/day
-    """
-    return etr * crop_kc
+import argparse  # For the non-interactive batch command line
+import itertools  # For the cross product of soil and crop types
+import os  # For building output file paths
+import sys  # For exiting with an error message
 
-# Function to interpolate monthly data to daily values using linear interpolation
-def interpolate_monthly_to_daily(monthly_data, season_months):
-    """
-    Interpolates monthly data to daily values for the growing season using linear interpolation.
-    
-    Parameters:
-    - monthly_data: List of monthly data (e.g., ETr or rainfall)
-    - season_months: List of integers representing months in the growing season
-    
-    Returns:
-    - daily_data: List of interpolated daily data values for the entire growing season
-    """
-    daily_data = []
-    for i in range(len(season_months) - 1):
-        start = monthly_data[i]
-        end = monthly_data[i + 1]
-        # Calculate the number of days in the month
-        days_in_month = (datetime.date(2024, season_months[i + 1], 1) - datetime.date(2024, season_months[i], 1)).days
-        # Generate daily values within the month using linear interpolation
-        daily_values = np.linspace(start, end, days_in_month, endpoint=False)
-        daily_data.extend(daily_values)
-    # Handle the transition from the last month to the next year (December to the first month)
-    start = monthly_data[-1]
-    end = monthly_data[0]
-    days_in_month = (datetime.date(2024, 12, 31) - datetime.date(2024, season_months[-1], 1)).days + 1
-    daily_values = np.linspace(start, end, days_in_month, endpoint=False)
-    daily_data.extend(daily_values[:days_in_month])  # Ensure this slice does not exceed the intended range
-    return daily_data
-
-# Main function to generate daily irrigation schedule for the growing season
-def daily_irrigation_schedule(soil, crop, climate, season_months, rainfall_data):
-    """
-    Generates a daily irrigation schedule for the crop based on soil, crop, and climate data.
-    
-    Parameters:
-    - soil: Dictionary containing soil properties (e.g., field capacity, wilting point)
-    - crop: Dictionary containing crop properties (e.g., growth stages, crop coefficient)
-    - climate: Dictionary containing monthly ETr and rainfall data
-    - season_months: List of months in the growing season
-    - rainfall_data: List of interpolated daily rainfall data
-    
-    Returns:
-    - schedule: A list of daily irrigation schedule records
-    """
-    schedule = []
-    # Interpolate ETr and rainfall data from monthly to daily values
-    daily_etr = interpolate_monthly_to_daily(climate['ETr'], season_months)
-    daily_rainfall = interpolate_monthly_to_daily(rainfall_data, season_months)
-    
-    day_count = 1  # Start the day count for the season
-    cumulative_soil_water_deficit = 0  # Initialize cumulative soil water deficit
-    max_allowable_depletion = 0.7 * (soil['field_capacity'] - soil['wilting_point']) * crop['root_depth'] * 10  # Max allowable soil depletion
-
-    # Loop through each crop growth stage (e.g., initial, development, mid-season, late-season)
-    for stage, properties in crop['growth_stages'].items():
-        days = properties['days']  # Days in the current growth stage
-        kc = properties['kc']  # Crop coefficient for the current stage
-        
-        # Process each day in the current growth stage
-        for day in range(days):
-            daily_climate = {
-                'ETr': daily_etr[day_count - 1],  # Get the daily ETr value
-                'Rainfall': daily_rainfall[day_count - 1]  # Get the daily rainfall value
-            }
-
-            # Calculate crop water use (ETc)
-            etc = calculate_et(kc, daily_climate['ETr'])
-
-            # Calculate effective rainfall (assuming no losses)
-            effective_rainfall = max(daily_climate['Rainfall'] - 0, 0)  # No losses in this example
-
-            # Determine net irrigation requirement
-            soil_water_deficit = effective_rainfall - etc
-
-            # Update the cumulative soil water deficit
-            cumulative_soil_water_deficit += soil_water_deficit
-
-            # Check if irrigation is needed
-            if cumulative_soil_water_deficit > max_allowable_depletion:
-                irrigation_required = True
-                daily_irrigation_req = max_allowable_depletion  # Apply maximum allowable irrigation
-                applied_water = daily_irrigation_req
-                cumulative_soil_water_deficit = 0  # Reset soil water deficit after irrigation
-            else:
-                irrigation_required = False
-                daily_irrigation_req = 0  # No irrigation needed
-                applied_water = 0
-
-            # Append the daily irrigation data to the schedule
-            schedule.append({
-                'day': day_count,  # Day of the season
-                'growing_season': 'Kharif',  # Kharif season in this example
-                'growth_stage': stage,  # Current growth stage
-                'crop_type': crop['crop_type'],  # Crop type (e.g., cotton)
-                'kc': kc,  # Crop coefficient
-                'ETo (mm/day)': daily_climate['ETr'],  # Reference evapotranspiration (ETr)
-                'Crop water use (Etc) (mm/day)': etc,  # Crop evapotranspiration (ETc)
-                'Rainfall (mm)': daily_climate['Rainfall'],  # Daily rainfall
-                'Net Irrigation application (mm)': round(daily_irrigation_req, 2),  # Net irrigation required
-                'Cumulative soil water deficit (mm)': round(cumulative_soil_water_deficit, 2),  # Soil water deficit
-                'Irrigation Required': 'Yes' if irrigation_required else 'No'  # Whether irrigation is required
-            })
-            day_count += 1  # Increment the day count
-    return schedule  # Return the generated irrigation schedule
+# Import the scheduling functions from the irrigation package
+from irrigation.et import modified_penman_batch  # Daily ETr from daily weather
+from irrigation.scheduling import KC_CURVES, daily_irrigation_schedule, growth_stages, schedule_by_date  # Daily soil water balance
+from irrigation.excel import load_scheduling_workbook  # Excel input
+from irrigation.writers import WRITERS, write_schedule_output  # Excel, Parquet, CSV or Arrow IPC output
 
 # Correct file path for reading Excel data
 file_path = r"D:\E\Master Courses\Semesters\Fifth Semester\CE-577 Irrigation System Design and Management\Term Project 2\Climatic_Data.xlsx"
 
-# Read soil, crop, and climatic data from the Excel file
-soil_data = pd.read_excel(file_path, sheet_name="Soil")
-crop_data = pd.read_excel(file_path, sheet_name="Crops")
-climatic_data = pd.read_excel(file_path, sheet_name="Climate")
-
-# Handle potential missing sheet or columns for rainfall data
-try:
-    rainfall_data = pd.read_excel(file_path, sheet_name="Rainfall")
-except KeyError:
-    print("Error: 'Rainfall' sheet or column not found in Excel file.")
-    exit()
-
-# Ask user for input to specify soil type and crop type
-soil_type = input("Enter the soil type (sand, sandy loam, loam, clay loam, silty clay, clay): ").strip().lower()
-crop_type = input("Enter the crop type (cotton, sugarcane, rice, maize, wheat): ").strip().lower()
-
-# Extract soil and crop properties based on user input
-soil = soil_data[soil_data['soil_type'] == soil_type].iloc[0].to_dict()
-crop = crop_data[crop_data['crop_type'] == crop_type].iloc[0].to_dict()
-
-# Define crop growth stages with crop coefficient (kc) and duration
-crop['growth_stages'] = {
-    'initial': {'kc': crop['initial_kc'], 'days': crop['initial_days']},
-    'development': {'kc': crop['development_kc'], 'days': crop['development_days']},
-    'mid-season': {'kc': crop['mid_season_kc'], 'days': crop['mid_season_days']},
-    'late-season': {'kc': crop['late_season_kc'], 'days': crop['late_season_days']}
-}
+# Correct file path for saving the output schedule
+output_file = r"D:\E\Master Courses\Semesters\Fifth Semester\CE-577 Irrigation System Design and Management\Term Project 2\Irrigation_Schedule.xlsx"
 
 # Define the months for the Kharif season (April to September)
 season_months = [4, 5, 6, 7, 8, 9]
 
-# Extract climatic data for the Kharif season
-monthly_etr = climatic_data['ETr'][0:6].tolist()
-monthly_rainfall = rainfall_data['Rainfall (mm)'][0:6].tolist()
-
-# Combine ETr and rainfall data into a single climatic conditions dictionary
-climatic_conditions = {
-    'ETr': monthly_etr,
-    'Rainfall': monthly_rainfall
-}
+# Function to extract the soil and crop properties of one soil/crop combination
+def select_soil_and_crop(soil_data, crop_data, soil_type, crop_type):
+    """
+    Extracts the soil and crop properties for a soil type and crop type.
 
-# Generate the irrigation schedule
-schedule = daily_irrigation_schedule(soil, crop, climatic_conditions, season_months, monthly_rainfall)
+    Parameters:
+    - soil_data: DataFrame of the Soil sheet
+    - crop_data: DataFrame of the Crops sheet
+    - soil_type: Soil type to select (e.g., loam)
+    - crop_type: Crop type to select (e.g., cotton)
 
-# Create a DataFrame from the schedule for easier handling
-schedule_df = pd.DataFrame(schedule)
+    Returns:
+    - soil, crop: Dictionaries of soil and crop properties, with the crop growth stages defined
+    """
+    soil = soil_data[soil_data['soil_type'] == soil_type].iloc[0].to_dict()
+    crop = crop_data[crop_data['crop_type'] == crop_type].iloc[0].to_dict()
 
-# Correct file path for saving the output schedule
-output_file = r"D:\E\Master Courses\Semesters\Fifth Semester\CE-577 Irrigation System Design and Management\Term Project 2\Irrigation_Schedule.xlsx"
+    # Define crop growth stages with crop coefficient (kc) and duration
+    crop['growth_stages'] = growth_stages(crop)
+    return soil, crop
 
-# Set up the workbook and worksheet for output
-wb = Workbook()
-ws = wb.active
-
-# Write the headers to the Excel sheet
-headers = ['Day', 'Growing Season', 'Growth Stage', 'Crop Type', 'Kc', 'ETo (mm/day)', 'Crop water use (Etc) (mm/day)', 'Rainfall (mm)', 'Net Irrigation application (mm)', 'Cumulative soil water deficit (mm)', 'Irrigation Required']
-for col_idx, header in enumerate(headers):
-    ws.cell(row=1, column=col_idx+1, value=header)  # Write header values
-    ws.cell(row=1, column=col_idx+1).font = Font(bold=True)  # Set header font to bold
-
-# Write the irrigation schedule data starting from row 2
-for idx, row in schedule_df.iterrows():
-    ws.append([
-        row['day'],
-        row['growing_season'],
-        row['growth_stage'],
-        row['crop_type'],
-        row['kc'],
-        round(row['ETo (mm/day)'], 2),  # Round values to 2 decimal places
-        round(row['Crop water use (Etc) (mm/day)'], 2),
-        round(row['Rainfall (mm)'], 2),
-        round(row['Net Irrigation application (mm)'], 2),
-        round(row['Cumulative soil water deficit (mm)'], 2),
-        row['Irrigation Required']
-    ])
-
-# Save the workbook to the output file
-wb.save(output_file)
-print(f"Irrigation Schedule results saved to {output_file}")
\ No newline at end of file
+# Function to build the command line parser of the batch runner
+def build_parser():
+    """
+    Builds the command line parser.
+
+    Soil and crop types can be listed one by one or given as 'all' to use every
+    row of the Soil or Crops sheet; the full cross product of the selected types
+    is scheduled. Without --soil and --crop the script asks for them interactively.
+    With --daily-climate, ETr is computed for every day of the weather file and the
+    season starts on --sowing-date, instead of interpolating the monthly ETr and
+    rainfall of the Climate and Rainfall sheets.
+    """
+    parser = argparse.ArgumentParser(description="Generate daily irrigation schedules for soil/crop combinations.")
+    parser.add_argument('--workbook', default=file_path, help="Excel workbook with Soil, Crops, Climate and Rainfall sheets")
+    parser.add_argument('--soil', nargs='+', help="Soil types to schedule, or 'all'")
+    parser.add_argument('--crop', nargs='+', help="Crop types to schedule, or 'all'")
+    parser.add_argument('--output-dir', default=os.path.dirname(output_file), help="Directory for the schedule files")
+    parser.add_argument('--format', choices=sorted(WRITERS), default='xlsx', help="Output format of the schedules")
+    parser.add_argument('--daily-climate', help="CSV of daily weather (date, Modified Penman columns, 'Rainfall (mm)') used instead of the monthly sheets")
+    parser.add_argument('--sowing-date', help="First day of the season in the daily weather (YYYY-MM-DD)")
+    parser.add_argument('--kc-curve', choices=KC_CURVES, default='stages',
+                        help="Daily Kc: constant in each growth stage, or the FAO-56 curve with linear development and late stages")
+    parser.add_argument('--cache-dir', help="Directory for the parsed workbook cache (default: next to the workbook)")
+    parser.add_argument('--no-cache', action='store_true', help="Always parse the workbook instead of using the cache")
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    # Read soil, crop, climatic and rainfall data from the Excel file in a single pass
+    try:
+        soil_data, crop_data, climatic_data, rainfall_data = load_scheduling_workbook(args.workbook, args.cache_dir, not args.no_cache)
+    except KeyError as e:
+        # Handle a missing sheet or column, naming the one that is missing
+        sys.exit(f"Error: {e} not found in {args.workbook}")
+
+    if args.daily_climate is not None:
+        import pandas as pd  # For reading the daily weather file
+
+        if args.sowing_date is None:
+            parser.error("--sowing-date is required with --daily-climate")
+        # Compute ETr for every day of the weather file in one vectorized call
+        daily_weather = pd.read_csv(args.daily_climate, parse_dates=['date']).sort_values('date')
+        daily_etr = modified_penman_batch(daily_weather)
+        daily_rainfall = daily_weather['Rainfall (mm)'].to_numpy(dtype=float)
+
+    # Extract climatic data for the Kharif season
+    monthly_etr = climatic_data['ETr'][0:6].tolist()
+    monthly_rainfall = rainfall_data['Rainfall (mm)'][0:6].tolist()
+
+    # Combine ETr and rainfall data into a single climatic conditions dictionary
+    climatic_conditions = {
+        'ETr': monthly_etr,
+        'Rainfall': monthly_rainfall
+    }
+
+    if args.soil is None and args.crop is None:
+        # Ask user for input to specify soil type and crop type
+        soil_type = input("Enter the soil type (sand, sandy loam, loam, clay loam, silty clay, clay): ").strip().lower()
+        crop_type = input("Enter the crop type (cotton, sugarcane, rice, maize, wheat): ").strip().lower()
+        soil_types, crop_types = [soil_type], [crop_type]
+    else:
+        # Expand 'all' (or a missing option) to every soil or crop type in the workbook
+        soil_types = soil_data['soil_type'].tolist() if args.soil in (None, ['all']) else [s.strip().lower() for s in args.soil]
+        crop_types = crop_data['crop_type'].tolist() if args.crop in (None, ['all']) else [c.strip().lower() for c in args.crop]
+
+    # Check every requested type before scheduling anything
+    known_soils, known_crops = set(soil_data['soil_type']), set(crop_data['crop_type'])
+    unknown_soils = [s for s in soil_types if s not in known_soils]
+    unknown_crops = [c for c in crop_types if c not in known_crops]
+    if unknown_soils:
+        parser.error(f"unknown soil types: {', '.join(unknown_soils)}")
+    if unknown_crops:
+        parser.error(f"unknown crop types: {', '.join(unknown_crops)}")
+
+    os.makedirs(args.output_dir or os.curdir, exist_ok=True)
+    if args.soil is None and args.crop is None:
+        combinations = [(soil_type, crop_type, os.path.join(args.output_dir, f"Irrigation_Schedule.{args.format}"))]
+    else:
+        combinations = [
+            (soil_type, crop_type, os.path.join(args.output_dir, f"Irrigation_Schedule_{soil_type}_{crop_type}.{args.format}".replace(' ', '_')))
+            for soil_type, crop_type in itertools.product(soil_types, crop_types)
+        ]
+
+    for soil_type, crop_type, schedule_file in combinations:
+        # Extract soil and crop properties for this combination
+        soil, crop = select_soil_and_crop(soil_data, crop_data, soil_type, crop_type)
+
+        # Generate the irrigation schedule
+        if args.daily_climate is not None:
+            schedule = schedule_by_date(soil, crop, daily_weather['date'], daily_etr, daily_rainfall, args.sowing_date, kc_curve=args.kc_curve)
+        else:
+            schedule = daily_irrigation_schedule(soil, crop, climatic_conditions, season_months, monthly_rainfall, kc_curve=args.kc_curve)
+
+        # Save the schedule to the output file
+        write_schedule_output(schedule, schedule_file, args.format)
+        print(f"Irrigation Schedule results saved to {schedule_file}")
+
+if __name__ == "__main__":
+    main()
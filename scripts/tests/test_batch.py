@@ -0,0 +1,99 @@
+# Tests of the batch water balance and planting-date sweep in irrigation.batch
+import numpy as np
+import pytest
+
+from irrigation.batch import batch_irrigation_schedule, crop_stage_arrays, daily_kc_matrix, planting_date_sweep
+from irrigation.scheduling import growth_stages, schedule_by_date, schedule_daily_series
+
+
+# Random soils and crops with growth stages of different lengths
+def random_fields(rng, fields):
+    soils, crops = [], []
+    for _ in range(fields):
+        wilting_point = rng.uniform(5.0, 20.0)
+        soils.append({'field_capacity': wilting_point + rng.uniform(5.0, 20.0), 'wilting_point': wilting_point})
+        crop = {'crop_type': 'crop', 'root_depth': rng.uniform(0.3, 1.5)}
+        for stage, kc in zip(['initial', 'development', 'mid_season', 'late_season'], np.sort(rng.uniform(0.3, 1.2, 4))):
+            crop[f'{stage}_kc'] = kc
+            crop[f'{stage}_days'] = int(rng.integers(10, 50))
+        crop['growth_stages'] = growth_stages(crop)
+        crops.append(crop)
+    return soils, crops
+
+
+# Daily weather with wet spells, so that fields are irrigated as well as drying out
+def random_weather(rng, shape):
+    daily_etr = rng.uniform(3.0, 9.0, shape)
+    daily_rainfall = rng.exponential(20.0, shape) * (rng.random(shape) < 0.5)
+    return daily_etr, daily_rainfall
+
+
+@pytest.mark.parametrize('kc_curve', ['stages', 'fao56'])
+def test_batch_schedule_matches_daily_schedule(kc_curve):
+    rng = np.random.default_rng(0)
+    soils, crops = random_fields(rng, 200)
+    stage_kc, stage_days = crop_stage_arrays(crops)
+    kc, active = daily_kc_matrix(stage_kc, stage_days, kc_curve=kc_curve)
+    days = len(kc)
+    daily_etr, daily_rainfall = random_weather(rng, (days, len(crops)))
+
+    result = batch_irrigation_schedule(
+        [soil['field_capacity'] for soil in soils], [soil['wilting_point'] for soil in soils],
+        [crop['root_depth'] for crop in crops], kc, daily_etr, daily_rainfall, active, keep_daily=True,
+    )
+    assert result.irrigation_events.sum() > 0
+
+    for field, (soil, crop) in enumerate(zip(soils, crops)):
+        schedule = schedule_daily_series(soil, crop, daily_etr[:, field], daily_rainfall[:, field], kc_curve=kc_curve)
+        season_length = len(schedule)
+        assert result.season_length[field] == season_length
+        assert np.array_equal(result.irrigation_required[:season_length, field], schedule.irrigation_required)
+        assert np.array_equal(result.etc[:season_length, field], schedule.etc)
+        assert np.array_equal(np.round(result.soil_water_deficit[:season_length, field], 2), schedule.soil_water_deficit)
+        assert result.irrigation_events[field] == schedule.irrigation_required.sum()
+
+        # Inactive days after the season ends change nothing
+        assert not result.irrigation_required[season_length:, field].any()
+        assert not result.etc[season_length:, field].any()
+        assert (result.soil_water_deficit[season_length:, field] == result.final_soil_water_deficit[field]).all()
+
+
+@pytest.mark.parametrize('kc_curve', ['stages', 'fao56'])
+def test_planting_date_sweep_matches_schedule_by_date(kc_curve):
+    rng = np.random.default_rng(1)
+    soils, crops = random_fields(rng, 3)
+    dates = np.datetime64('2024-01-01') + np.arange(400)
+    daily_etr, daily_rainfall = random_weather(rng, len(dates))
+
+    for soil, crop in zip(soils, crops):
+        result = planting_date_sweep(soil, crop, dates, daily_etr, daily_rainfall, '2024-02-01', kc_curve=kc_curve)
+        assert len(result.sowing_date) == 90
+        assert result.sowing_date[0] == np.datetime64('2024-02-01')
+        max_allowable_depletion = 0.7 * (soil['field_capacity'] - soil['wilting_point']) * crop['root_depth'] * 10
+
+        for sowing, sowing_date in enumerate(result.sowing_date):
+            schedule = schedule_by_date(soil, crop, dates, daily_etr, daily_rainfall, sowing_date, kc_curve=kc_curve)
+            events = schedule.irrigation_required.sum()
+            assert result.irrigation_events[sowing] == events
+            assert result.total_etc[sowing] == pytest.approx(schedule.etc.sum(), rel=1e-12)
+            assert result.total_irrigation[sowing] == pytest.approx(events * max_allowable_depletion, rel=1e-12)
+
+
+def test_planting_date_sweep_rejects_missing_dates():
+    rng = np.random.default_rng(2)
+    soils, crops = random_fields(rng, 1)
+    dates = np.datetime64('2024-01-01') + np.arange(400)
+    daily_etr, daily_rainfall = random_weather(rng, len(dates))
+
+    # Sowing date not in the climate data
+    with pytest.raises(KeyError):
+        planting_date_sweep(soils[0], crops[0], dates, daily_etr, daily_rainfall, '2023-12-01')
+
+    # A day missing within the seasons of the window
+    gap = np.delete(np.arange(len(dates)), 150)
+    with pytest.raises(ValueError):
+        planting_date_sweep(soils[0], crops[0], dates[gap], daily_etr[gap], daily_rainfall[gap], '2024-02-01')
+
+    # Climate data ending before the season of the last sowing date
+    with pytest.raises(ValueError):
+        planting_date_sweep(soils[0], crops[0], dates[:100], daily_etr[:100], daily_rainfall[:100], '2024-02-01')
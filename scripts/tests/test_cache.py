@@ -0,0 +1,63 @@
+# Tests of the sidecar cache of parsed workbook sheets in irrigation.cache
+import os
+
+import pandas as pd
+import pytest
+
+from irrigation import cache
+from irrigation.excel import read_sheets
+
+pytest.importorskip('pyarrow')
+pytest.importorskip('openpyxl')
+
+
+# Write a small workbook with a Soil and a Climate sheet
+def write_workbook(path, field_capacity=30.0):
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({'soil_type': ['clay', 'sand'], 'field_capacity': [field_capacity, 10.0]}).to_excel(
+            writer, sheet_name='Soil', index=False)
+        pd.DataFrame({'Month': ['Apr', 'May'], 'ETr': [8.38, 10.21]}).to_excel(writer, sheet_name='Climate', index=False)
+
+
+def test_cache_reused_while_workbook_unchanged(tmp_path):
+    workbook = str(tmp_path / 'data.xlsx')
+    write_workbook(workbook)
+    sheets = read_sheets(workbook, ['Soil', 'Climate'])
+
+    cached, workbook_sheet_names = cache.read_cached_sheets(workbook, ['Soil', 'Climate'])
+    assert workbook_sheet_names == ['Soil', 'Climate']
+    assert all(cached[name].equals(sheets[name]) for name in sheets)
+
+    # Touching the workbook changes its mtime but not its contents
+    stat = os.stat(workbook)
+    os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cached, workbook_sheet_names = cache.read_cached_sheets(workbook, ['Soil'])
+    assert workbook_sheet_names is not None and cached['Soil'].equals(sheets['Soil'])
+
+
+def test_cache_invalidated_when_workbook_changes(tmp_path):
+    workbook = str(tmp_path / 'data.xlsx')
+    write_workbook(workbook)
+    read_sheets(workbook, ['Soil'])
+
+    write_workbook(workbook, field_capacity=35.0)
+    assert cache.read_cached_sheets(workbook, ['Soil']) == ({}, None)
+    assert read_sheets(workbook, ['Soil'])['Soil']['field_capacity'].tolist() == [35.0, 10.0]
+
+
+def test_corrupt_cache_file_read_from_workbook(tmp_path):
+    workbook = str(tmp_path / 'data.xlsx')
+    write_workbook(workbook)
+    expected = read_sheets(workbook, ['Soil'])['Soil']
+
+    # Truncate the cached sheet
+    directory = cache.cache_directory(workbook)
+    for name in os.listdir(directory):
+        if name.endswith('.parquet'):
+            open(os.path.join(directory, name), 'w').close()
+
+    assert read_sheets(workbook, ['Soil'])['Soil'].equals(expected)
+    # The sheet was cached again from the workbook
+    cached, _ = cache.read_cached_sheets(workbook, ['Soil'])
+    assert cached['Soil'].equals(expected)
+    assert not [name for name in os.listdir(directory) if name.endswith('.tmp')]
@@ -0,0 +1,68 @@
+# Tests of the persistent field-state checkpoints in irrigation.checkpoint
+import numpy as np
+import pytest
+
+from irrigation.checkpoint import FieldState, load_field_states, save_field_states, update_field_checkpoints
+from irrigation.scheduling import growth_stages, schedule_daily_series
+
+SOIL = {'soil_type': 'loam', 'field_capacity': 25.0, 'wilting_point': 12.0}
+CROP = {
+    'crop_type': 'maize', 'root_depth': 1.0,
+    'initial_kc': 0.3, 'initial_days': 20, 'development_kc': 0.7, 'development_days': 35,
+    'mid_season_kc': 1.2, 'mid_season_days': 40, 'late_season_kc': 0.6, 'late_season_days': 30,
+}
+CROP['growth_stages'] = growth_stages(CROP)
+SEASON_LENGTH = 125
+
+
+# Daily weather with wet spells, so that the season has irrigations and negative deficits
+def daily_weather(days=SEASON_LENGTH + 10):
+    rng = np.random.default_rng(1)
+    daily_etr = rng.uniform(3.0, 9.0, days)
+    daily_rainfall = rng.exponential(20.0, days) * (rng.random(days) < 0.5)
+    return daily_etr, daily_rainfall
+
+
+@pytest.mark.parametrize('skip_to_events', [False, True])
+@pytest.mark.parametrize('kc_curve', ['stages', 'fao56'])
+def test_season_in_parts_matches_whole_season(tmp_path, kc_curve, skip_to_events):
+    daily_etr, daily_rainfall = daily_weather()
+    whole = schedule_daily_series(SOIL, CROP, daily_etr, daily_rainfall, kc_curve=kc_curve)
+    assert whole.irrigation_required.any()
+
+    # Feed the days in uneven parts, running past the end of the season
+    checkpoint_file = str(tmp_path / 'fields.npz')
+    parts, day = [], 0
+    for days in [1, 3, 1, 20, 7, 1, 50, 2, 60]:
+        schedules = update_field_checkpoints(
+            checkpoint_file, {'field-1': (SOIL, CROP)},
+            {'field-1': (daily_etr[day:day + days], daily_rainfall[day:day + days])}, kc_curve=kc_curve,
+            skip_to_events=skip_to_events,
+        )
+        parts.append(schedules['field-1'])
+        day += days
+
+    for column in ('day', 'stage_index', 'kc', 'etr', 'etc', 'rainfall', 'net_irrigation',
+                   'soil_water_deficit', 'irrigation_required'):
+        assert np.array_equal(np.concatenate([getattr(part, column) for part in parts]), getattr(whole, column)), column
+
+    state = load_field_states(checkpoint_file)['field-1']
+    assert state.day == SEASON_LENGTH
+    assert state.stage_index == 3
+    assert state.kc == whole.kc[-1]
+
+
+def test_field_states_round_trip(tmp_path):
+    states = {
+        'field-1': FieldState(0, 0, 0.3, 0.0),
+        'field 2/ü': FieldState(57, 2, 1.2, -123.456789012345678),
+        '3': FieldState(125, 3, 0.6, 49.99999999999999),
+    }
+    checkpoint_file = str(tmp_path / 'fields.npz')
+    save_field_states(checkpoint_file, states)
+    loaded = load_field_states(checkpoint_file)
+
+    assert loaded == states
+    assert all(type(value) is type(expected) for state, expected_state in zip(loaded.values(), states.values())
+               for value, expected in zip(state, expected_state))
+    assert load_field_states(str(tmp_path / 'missing.npz')) == {}
@@ -0,0 +1,77 @@
+# Tests of the ET methods and temperature lookup tables in irrigation.et
+import numpy as np
+import pytest
+
+from irrigation.et import (
+    PENMAN_COLUMNS,
+    TemperatureTables,
+    modified_penman_batch,
+    modified_penman_method,
+    reference_et_batch,
+    round_et,
+    saturation_vapor_pressure,
+    slope_of_saturation_curve,
+)
+
+TERMS = {'Delta': slope_of_saturation_curve, 'e_s': saturation_vapor_pressure}
+
+
+# Scalars inside and outside the table range (-30 to 60 °C), and an array mixing both
+@pytest.mark.parametrize('T_mean', [25.3, 80.0, -45.0, np.float64(30.0), np.array([[10.0, 70.0], [25.0, -50.0]])])
+@pytest.mark.parametrize('name', sorted(TERMS))
+def test_lookup_matches_exact_term(name, T_mean):
+    tables = TemperatureTables()
+    values = tables.lookup(name, T_mean)
+    assert np.shape(values) == np.shape(T_mean)
+    np.testing.assert_allclose(values, TERMS[name](np.asarray(T_mean)), rtol=tables.max_relative_error[name] * 1.01)
+
+
+# FAO-56 Example 18 (Brussels, 6 July): T_max 21.5 °C, T_min 12.3 °C, altitude 100 m,
+# u_2 2.078 m/s, R_n 13.28 MJ/m^2/day and e_a 1.409 kPa give ETo = 3.9 mm/day
+@pytest.mark.parametrize('tables', [None, TemperatureTables()])
+def test_penman_monteith_fao56_example_18(tables):
+    L = 2500.78 - 2.3601 * (21.5 + 12.3) / 2  # Latent heat of vaporization used to convert R_n to mm/day
+    e_s = (saturation_vapor_pressure(21.5) + saturation_vapor_pressure(12.3)) / 2  # mbar
+    data = {
+        'T_max': [21.5], 'T_min': [12.3],
+        'RH_mean': [100 * 14.09 / e_s],  # Mean RH giving e_a = 1.409 kPa
+        'E': [100.0], 'z': [2.0], 'U_z': [2.078 * 86.4], 'R_n': [13.28 / (L / 1000)],
+    }
+    assert reference_et_batch(data, 'penman_monteith', tables)[0] == pytest.approx(3.9, abs=0.05)
+
+
+# FAO-56 with e_s as the mean of e°(T_max) and e°(T_min) (eq. 12) for a hot, dry day
+def test_penman_monteith_uses_mean_saturation_vapor_pressure():
+    data = {'T_max': [40.0], 'T_min': [20.0], 'RH_mean': [40.0], 'E': [0.0], 'z': [2.0], 'U_z': [200.0], 'R_n': [6.0]}
+
+    def e0(T):  # FAO-56 eq. 11 (kPa)
+        return 0.6108 * np.exp(17.27 * T / (T + 237.3))
+
+    T_mean, U_2, R_n, Gamma = 30.0, 200 / 86.4, 6.0 * 2.45, 0.000665 * 101.3
+    Delta = 4098 * e0(T_mean) / (T_mean + 237.3) ** 2
+    e_s = (e0(40.0) + e0(20.0)) / 2
+    expected = (0.408 * Delta * R_n + Gamma * 900 / (T_mean + 273) * U_2 * 0.6 * e_s) / (Delta + Gamma * (1 + 0.34 * U_2))
+    assert reference_et_batch(data, 'penman_monteith')[0] == pytest.approx(expected, rel=0.01)
+
+
+# The vectorized Modified Penman Method agrees with the scalar function record by record
+def test_modified_penman_batch_matches_scalar_method():
+    rng = np.random.default_rng(0)
+    rows = 10000
+    data = {
+        'T_max': rng.uniform(20.0, 48.0, rows), 'T_min': rng.uniform(0.0, 30.0, rows),
+        'RH_mean': rng.uniform(10.0, 95.0, rows), 'E': rng.uniform(0.0, 3000.0, rows),
+        'z': rng.uniform(2.0, 10.0, rows), 'U_day_night': rng.uniform(1.0, 4.0, rows),
+        'U_z': rng.uniform(20.0, 500.0, rows), 'R_s': rng.uniform(100.0, 800.0, rows), 'R_n': rng.uniform(1.0, 12.0, rows),
+    }
+    batch = modified_penman_batch(data)
+    scalar = np.array([modified_penman_method(*(data[name][row] for name in PENMAN_COLUMNS)) for row in range(rows)])
+
+    # NumPy's vectorized power may differ from the scalar one in the last bit
+    np.testing.assert_allclose(batch, scalar, rtol=1e-14, atol=0)
+    assert [round(value, 2) for value in batch.tolist()] == [round(float(value), 2) for value in scalar]
+
+
+def test_round_et_rounds_like_python_floats():
+    values = np.array([2.745, 1.005, 0.125, 3.14159, -1.555])
+    assert round_et(values).tolist() == [round(value, 2) for value in values.tolist()]
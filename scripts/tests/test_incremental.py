@@ -0,0 +1,59 @@
+# Tests of the incremental ETr store in irrigation.incremental
+import numpy as np
+import pandas as pd
+import pytest
+
+from irrigation.et import modified_penman_batch, round_et
+from irrigation.incremental import incremental_etr
+
+pytest.importorskip('pyarrow')
+
+
+# Daily records of two stations
+def station_records(rng, days=100):
+    rows = 2 * days
+    return pd.DataFrame({
+        'station': np.repeat(['a', 'b'], days),
+        'date': np.tile(np.datetime64('2024-01-01') + np.arange(days), 2),
+        'T_max': rng.uniform(25.0, 45.0, rows), 'T_min': rng.uniform(5.0, 25.0, rows),
+        'RH_mean': rng.uniform(10.0, 90.0, rows), 'E': 150.0, 'z': 2.0, 'U_day_night': 2.0,
+        'U_z': rng.uniform(50.0, 400.0, rows), 'R_s': rng.uniform(200.0, 700.0, rows), 'R_n': rng.uniform(2.0, 12.0, rows),
+    })
+
+
+def test_incremental_etr_recomputes_only_new_and_changed_records(tmp_path):
+    rng = np.random.default_rng(0)
+    records = station_records(rng)
+    store = str(tmp_path / 'etr.parquet')
+
+    result, recomputed = incremental_etr(records, store)
+    assert recomputed == len(records)
+    assert np.array_equal(result['ETr'].to_numpy(), round_et(modified_penman_batch(records)))
+
+    result, recomputed = incremental_etr(records, store)
+    assert recomputed == 0
+    assert np.array_equal(result['ETr'].to_numpy(), round_et(modified_penman_batch(records)))
+
+    # Only the last days are rerun: one edited record and one new day
+    latest = records[records['date'] >= np.datetime64('2024-04-01')].copy()
+    latest.loc[latest.index[0], 'T_max'] += 1.0
+    new_day = latest.iloc[[-1]].assign(date=np.datetime64('2024-04-10'))
+    latest = pd.concat([latest, new_day], ignore_index=True)
+    result, recomputed = incremental_etr(latest, store)
+    assert recomputed == 2
+    assert np.array_equal(result['ETr'].to_numpy(), round_et(modified_penman_batch(latest)))
+
+    # Stored records missing from the last input are kept
+    stored = pd.read_parquet(store)
+    assert len(stored) == len(records) + 1
+    expected = pd.concat([records, new_day], ignore_index=True)
+    expected.loc[(expected['station'] == latest['station'][0]) & (expected['date'] == latest['date'][0]), 'T_max'] += 1.0
+    merged = stored.merge(expected.assign(expected=round_et(modified_penman_batch(expected))), on=['station', 'date'])
+    assert len(merged) == len(stored)
+    assert np.array_equal(merged['ETr'].to_numpy(), merged['expected'].to_numpy())
+
+
+def test_incremental_etr_rejects_duplicate_keys(tmp_path):
+    records = station_records(np.random.default_rng(1), days=3)
+    with pytest.raises(ValueError):
+        incremental_etr(pd.concat([records, records.iloc[[0]]]), str(tmp_path / 'etr.parquet'))
@@ -0,0 +1,45 @@
+# Tests of the monthly-to-daily interpolation in irrigation.scheduling
+import datetime
+
+import numpy as np
+import pytest
+
+from irrigation.scheduling import interpolate_monthly_to_daily, interpolate_monthly_to_daily_batch, interpolation_operator
+
+
+# Original per-month np.linspace interpolation of the scheduling script
+def reference_interpolation(monthly_data, season_months):
+    daily_data = []
+    for i in range(len(season_months) - 1):
+        days_in_month = (datetime.date(2024, season_months[i + 1], 1) - datetime.date(2024, season_months[i], 1)).days
+        daily_data.extend(np.linspace(monthly_data[i], monthly_data[i + 1], days_in_month, endpoint=False))
+    days_in_month = (datetime.date(2024, 12, 31) - datetime.date(2024, season_months[-1], 1)).days + 1
+    daily_data.extend(np.linspace(monthly_data[-1], monthly_data[0], days_in_month, endpoint=False))
+    return daily_data
+
+
+@pytest.mark.parametrize('season_months', [[4, 5, 6, 7, 8, 9], [1, 2, 3], list(range(1, 13))])
+def test_batch_interpolation_matches_linspace_loop(season_months):
+    rng = np.random.default_rng(0)
+    monthly_data = rng.uniform(0.0, 300.0, (len(season_months), 50))
+
+    daily_data = interpolate_monthly_to_daily_batch(monthly_data, season_months)
+    for series in range(monthly_data.shape[1]):
+        expected = np.array(reference_interpolation(monthly_data[:, series].tolist(), season_months))
+        # Bit-identical, not just close
+        assert np.array_equal(daily_data[:, series], expected)
+    assert interpolate_monthly_to_daily(monthly_data[:, 0].tolist(), season_months) == \
+        reference_interpolation(monthly_data[:, 0].tolist(), season_months)
+
+
+# The operator accepts the season as a list, like the other season functions
+@pytest.mark.parametrize('season_months', [[4, 5, 6, 7, 8, 9], (10, 11, 12, 1, 2, 3)])
+def test_interpolation_operator_matches_batch_interpolation(season_months):
+    rng = np.random.default_rng(1)
+    monthly_data = rng.uniform(0.0, 300.0, (len(season_months), 20))
+
+    operator = interpolation_operator(season_months)
+    assert operator is interpolation_operator(tuple(season_months))  # Cached
+    assert not operator.flags.writeable
+    np.testing.assert_allclose(operator @ monthly_data, interpolate_monthly_to_daily_batch(monthly_data, season_months),
+                               rtol=1e-12, atol=1e-12)
@@ -0,0 +1,53 @@
+# Tests of the process pool paths in irrigation.parallel and irrigation.sweep
+import numpy as np
+import pandas as pd
+
+from irrigation.et import PENMAN_COLUMNS, modified_penman_batch
+from irrigation.parallel import modified_penman_parallel
+from irrigation.scheduling import growth_stages
+from irrigation.sweep import scenario_sweep
+
+SOILS = [
+    {'soil_type': 'Loam', 'field_capacity': 30.0, 'wilting_point': 12.0},
+    {'soil_type': 'Sand', 'field_capacity': 15.0, 'wilting_point': 5.0},
+]
+
+
+# Crops with their growth stages
+def sweep_crops():
+    crops = []
+    for crop_type, root_depth, days in [('Wheat', 1.0, (20, 30, 40, 30)), ('Maize', 0.8, (15, 25, 35, 25))]:
+        crop = {'crop_type': crop_type, 'root_depth': root_depth}
+        for stage, kc, stage_days in zip(['initial', 'development', 'mid_season', 'late_season'], (0.4, 0.8, 1.15, 0.6), days):
+            crop[f'{stage}_kc'] = kc
+            crop[f'{stage}_days'] = stage_days
+        crop['growth_stages'] = growth_stages(crop)
+        crops.append(crop)
+    return crops
+
+
+def test_scenario_sweep_same_with_one_or_two_workers():
+    rng = np.random.default_rng(0)
+    climate = {
+        station: {'ETr': list(rng.uniform(2.0, 9.0, 12)), 'Rainfall': list(rng.uniform(0.0, 200.0, 12))}
+        for station in ['Lahore', 'Multan', 'Quetta']
+    }
+    crops = sweep_crops()
+
+    serial = scenario_sweep(SOILS, crops, climate, max_workers=1)
+    pooled = scenario_sweep(SOILS, crops, climate, max_workers=2)
+    assert len(serial) > 0
+    pd.testing.assert_frame_equal(serial, pooled)
+
+
+def test_modified_penman_parallel_same_with_one_or_two_workers():
+    rng = np.random.default_rng(1)
+    rows = 1000
+    data = {column: rng.uniform(1.0, 40.0, rows) for column in PENMAN_COLUMNS}
+    data['RH_mean'] = rng.uniform(10.0, 90.0, rows)
+    data['U_day_night'] = rng.uniform(1.0, 4.0, rows)
+
+    serial = modified_penman_parallel(data, max_workers=1)
+    pooled = modified_penman_parallel(data, max_workers=2, chunk_rows=128)
+    assert np.array_equal(serial, pooled)
+    assert np.array_equal(serial, modified_penman_batch(data))
@@ -0,0 +1,50 @@
+# Tests of the daily soil water balance in irrigation.scheduling
+import numpy as np
+import pytest
+
+from irrigation.scheduling import ScheduleResult, accumulate_soil_water_deficit
+
+
+# Day-by-day reference of the soil water balance, as in the original scheduler loop
+def reference_soil_water_deficit(soil_water_balance, max_allowable_depletion, soil_water_deficit):
+    out = np.empty(len(soil_water_balance))
+    irrigation_required = np.zeros(len(soil_water_balance), dtype=bool)
+    for day, balance in enumerate(soil_water_balance.tolist()):
+        soil_water_deficit += balance
+        if soil_water_deficit > max_allowable_depletion:
+            irrigation_required[day] = True
+            soil_water_deficit = 0
+        out[day] = soil_water_deficit
+    return out, irrigation_required, soil_water_deficit
+
+
+# Mean daily balances from deficits that never trigger irrigation to irrigation every day
+@pytest.mark.parametrize('mean_balance', [-3.0, 0.2, 1.0, 5.0, 17.0, 60.0])
+@pytest.mark.parametrize('skip_to_events', [False, True])
+def test_accumulate_soil_water_deficit_matches_day_loop(mean_balance, skip_to_events):
+    rng = np.random.default_rng(0)
+    soil_water_balance = rng.normal(mean_balance, 4.0, 5000)
+    expected, expected_irrigation, expected_final = reference_soil_water_deficit(soil_water_balance, 50.0, 1.5)
+
+    out = np.empty(len(soil_water_balance))
+    irrigation_required = np.zeros(len(soil_water_balance), dtype=bool)
+    final = accumulate_soil_water_deficit(soil_water_balance, 50.0, 1.5, out, irrigation_required, skip_to_events=skip_to_events)
+
+    # Bit-identical, not just close
+    assert np.array_equal(out, expected)
+    assert np.array_equal(irrigation_required, expected_irrigation)
+    assert final == expected_final
+
+
+# Records streamed block by block match the records indexed one by one, across block boundaries
+def test_schedule_records_iterate_in_blocks():
+    days = ScheduleResult.ITER_BLOCK_ROWS * 2 + 3
+    schedule = ScheduleResult(days, 'maize', ['initial', 'development'])
+    schedule.kc[:] = np.linspace(0.3, 1.2, days)
+    schedule.stage_index[days // 2:] = 1
+    schedule.irrigation_required[::7] = True
+
+    records = list(schedule)
+    assert len(records) == days
+    for day in (0, ScheduleResult.ITER_BLOCK_ROWS - 1, ScheduleResult.ITER_BLOCK_ROWS, days - 1):
+        assert records[day] == schedule[day]
@@ -0,0 +1,78 @@
+# Tests of the station table and per-station ET terms in irrigation.et
+import numpy as np
+import pandas as pd
+import pytest
+
+from irrigation.et import StationTable, extraterrestrial_radiation, reference_et_batch, station_et_batch
+
+METHODS = ['modified_penman', 'penman_monteith', 'hargreaves_samani']
+
+
+# Daily records of several stations, each repeating its station metadata
+def flat_records(rng, stations=5, days=60):
+    ids = np.repeat([f'station-{i}' for i in range(stations)], days)
+    metadata = {
+        'E': rng.uniform(0.0, 2500.0, stations), 'z': rng.uniform(2.0, 10.0, stations),
+        'U_day_night': rng.uniform(1.0, 4.0, stations), 'latitude': rng.uniform(-40.0, 40.0, stations),
+    }
+    rows = stations * days
+    data = pd.DataFrame({
+        'station': ids,
+        'date': np.tile(np.datetime64('2024-03-01') + np.arange(days), stations),
+        **{column: np.repeat(values, days) for column, values in metadata.items()},
+        'T_max': rng.uniform(25.0, 45.0, rows), 'T_min': rng.uniform(5.0, 25.0, rows),
+        'RH_mean': rng.uniform(10.0, 90.0, rows), 'U_z': rng.uniform(50.0, 400.0, rows),
+        'R_s': rng.uniform(200.0, 700.0, rows), 'R_n': rng.uniform(2.0, 12.0, rows),
+    })
+    dates = data['date'].to_numpy().astype('datetime64[D]')
+    day_of_year = (dates - dates.astype('datetime64[Y]')).astype(int) + 1
+    data['R_a'] = extraterrestrial_radiation(data['latitude'].to_numpy(), day_of_year)
+    return data
+
+
+def test_station_et_batch_matches_flat_records():
+    rng = np.random.default_rng(0)
+    data = flat_records(rng)
+    stations = StationTable.from_frame(data.drop_duplicates('station'))
+    records = data.drop(columns=['E', 'z', 'U_day_night', 'latitude'])
+    # Shuffle the records so that station positions are looked up, not assumed
+    records = records.sample(frac=1.0, random_state=1)
+
+    expected = reference_et_batch(data.loc[records.index], METHODS)
+    result = station_et_batch(records, stations, METHODS)
+    for method in METHODS:
+        np.testing.assert_allclose(result[method], expected[method], rtol=1e-13, err_msg=method)
+
+
+def test_station_et_batch_unknown_station():
+    rng = np.random.default_rng(0)
+    data = flat_records(rng)
+    stations = StationTable.from_frame(data[data['station'] != 'station-2'].drop_duplicates('station'))
+    with pytest.raises(KeyError):
+        station_et_batch(data.drop(columns=['E', 'z', 'U_day_night', 'latitude']), stations)
+    with pytest.raises(KeyError):
+        stations.index_of(pd.Series(['station-0', 'station-2'], dtype='category'))
+
+
+def test_split_records_matches_flat_records():
+    rng = np.random.default_rng(2)
+    data = flat_records(rng)
+    stations, records = StationTable.split_records(data.drop(columns='R_a'))
+
+    assert len(stations) == 5
+    assert isinstance(records['station'].dtype, pd.CategoricalDtype)
+    assert not {'E', 'z', 'U_day_night', 'latitude'} & set(records.columns)
+
+    # Hargreaves-Samani derives R_a from the station latitude and the record date
+    expected = reference_et_batch(data, METHODS)
+    result = station_et_batch(records, stations, METHODS)
+    for method in METHODS:
+        np.testing.assert_allclose(result[method], expected[method], rtol=1e-13, err_msg=method)
+
+
+def test_split_records_rejects_differing_station_metadata():
+    rng = np.random.default_rng(3)
+    data = flat_records(rng)
+    data.loc[7, 'E'] += 1.0
+    with pytest.raises(ValueError):
+        StationTable.split_records(data)